@@ -23,6 +23,7 @@ from . import __version__
 from .core import config
 from .core import logger
 from .githeat import Githeat
+from .multirepo import repo_paths
 
 DAY_REGEX = r"(?i)^(Sun|Mon|(T(ues|hurs))|Fri)(day|\.)" \
             r"?$|Wed(\.|nesday)?$|Sat(\.|urday)?$|T((ue?)|(hu?r?))\.?$"
@@ -56,6 +57,12 @@ def _cmdline(argv=None):
             raise ArgumentTypeError("%s: invalid positive int value" % value)
         return ivalue
 
+    def _check_positive(value):
+        ivalue = int(value)
+        if ivalue <= 0:
+            raise ArgumentTypeError("%s: invalid positive int value" % value)
+        return ivalue
+
     def _is_valid_days_list(days):
         try:
             if 7 < len(days) < 1:
@@ -99,6 +106,10 @@ def _cmdline(argv=None):
                         choices=['grass', 'fire', 'sky'],
                         help='Choose type of coloring you want for your graph')
 
+    parser.add_argument('--scale',
+                        choices=['linear', 'log', 'quantile'],
+                        help='Choose how daily contributions are mapped to colors')
+
     parser.add_argument('--stat-number',
                         dest='stat_number',
                         type=_check_negative,
@@ -125,6 +136,49 @@ def _cmdline(argv=None):
     parser.add_argument('--grep', '-g',
                         help='Filter by keywords in commits')
 
+    parser.add_argument('--columns',
+                        type=_check_positive,
+                        help="Terminal width to fit the graph in, detected by default")
+
+    parser.add_argument('--repos-from',
+                        dest='repos_from',
+                        metavar='FILE',
+                        help='Aggregate the repositories listed in FILE, one path '
+                             'per line')
+
+    parser.add_argument('--repos',
+                        dest='repos_glob',
+                        metavar='GLOB',
+                        help="Aggregate the repositories matching GLOB, e.g. '~/src/*'")
+
+    parser.add_argument('--collector',
+                        choices=['process', 'asyncio'],
+                        help='How repositories are read: a git log per worker process '
+                             '(uses the cache), or concurrent git processes driven '
+                             'by asyncio')
+
+    parser.add_argument('--jobs', '-j',
+                        type=_check_negative,
+                        help='Number of repositories to read at once')
+
+    parser.add_argument('--backend',
+                        choices=['git', 'odb'],
+                        help='Read commits with git log, or read the new commits of a '
+                             'cache update straight from the object database (Python '
+                             '3 only, falls back to git log when unsupported)')
+
+    parser.add_argument('--lazy',
+                        dest='lazy',
+                        action='store_true',
+                        help="Read only commit dates up front, and a day's commits "
+                             "when they are shown. Doesn't use the cache")
+
+    parser.add_argument('--no-cache',
+                        dest='cache',
+                        action='store_false',
+                        help="Don't read or write the commit cache, which is on by "
+                             "default and kept under $XDG_CACHE_HOME/githeat")
+
     parser.add_argument("-v", "--version",
                         action="version",
                         version="githeat {:s}".format(__version__),
@@ -155,13 +209,28 @@ def main(argv=None):
     logger.start(args.logging_level)
     logger.debug("executing githeat")
 
-    try:
-        g = Git(os.getcwd())
-    except (InvalidGitRepositoryError, GitCommandError, GitCommandNotFound):
-        print("Are you sure you're in an initialized git directory?")
-        return 0
+    options = vars(args)
+    repos_from = options.pop('repos_from', None)
+    repos_glob = options.pop('repos_glob', None)
+    if repos_from or repos_glob:
+        g = None
+        try:
+            repos = repo_paths(repos_from, repos_glob)
+        except (IOError, OSError) as e:
+            print("Can't read the repository list: {}".format(e))
+            return 1
+        if not repos:
+            print("No repositories found")
+            return 0
+    else:
+        repos = None
+        try:
+            g = Git(os.getcwd())
+        except (InvalidGitRepositoryError, GitCommandError, GitCommandNotFound):
+            print("Are you sure you're in an initialized git directory?")
+            return 0
 
-    githeat = Githeat(g, **vars(args))
+    githeat = Githeat(g, repos=repos, **options)
     githeat.run()
 
     logger.debug("successful completion")
@@ -0,0 +1,80 @@
+""" Concurrent git log collection with asyncio.
+
+Reading many small repositories is mostly spent waiting for git processes to
+start and finish. This collector runs `git log` for many repositories at once
+from a single event loop, at most `concurrency` at a time, and parses each
+process's output as it arrives. Unlike `multirepo.collect` it doesn't use the
+commit cache.
+
+"""
+from __future__ import absolute_import
+
+import asyncio
+from asyncio.subprocess import DEVNULL
+from asyncio.subprocess import PIPE
+
+from . import gitlog
+from . import multirepo
+from .store import CommitStore
+
+__all__ = "read_repo", "collect"
+
+CONCURRENCY = 16
+
+
+async def read_repo(path, args, semaphore, chunk_size=gitlog.CHUNK_SIZE):
+    """
+    Runs `git log` in path and streams its output into a CommitStore
+
+    :param path: repository path
+    :param args: `git log` arguments, see `gitlog.log_args`
+    :param semaphore: asyncio.Semaphore limiting the number of running processes
+    :param chunk_size: number of bytes to read at a time
+    :return: CommitStore, or None if path isn't a repository or git failed
+    """
+    if not multirepo.is_repository(path):
+        return None
+    async with semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'git', 'log', *args, cwd=path, stdin=DEVNULL, stdout=PIPE,
+                stderr=DEVNULL)
+        except OSError:  # missing git executable
+            return None
+
+        commits = CommitStore()
+        pending = b''
+        while True:
+            chunk = await process.stdout.read(chunk_size)
+            if not chunk:
+                break
+            records, pending = gitlog.split_records(pending, chunk)
+            for record in records:
+                commits.append(*gitlog.parse_commit(record))
+        if pending:
+            commits.append(*gitlog.parse_commit(pending))
+
+        if await process.wait():
+            return None
+        return commits
+
+
+async def _read_repos(paths, args, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*[read_repo(path, args, semaphore) for path in paths])
+
+
+def collect(paths, author=None, grep=None, concurrency=None):
+    """
+    Reads the commits of every repository concurrently and merges them into one
+    store
+
+    :param paths: repository paths
+    :param author: filter by author regex
+    :param grep: filter by keywords in commit messages
+    :param concurrency: maximum number of git processes running at once
+    :return: CommitStore
+    """
+    args = gitlog.log_args(author=author, grep=grep)
+    stores = asyncio.run(_read_repos(paths, args, concurrency or CONCURRENCY))
+    return multirepo.merge(paths, stores)
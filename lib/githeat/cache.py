@@ -0,0 +1,159 @@
+""" Persistent, incrementally updated on-disk cache of parsed commits.
+
+Parsed commits are stored per repository, filter arguments and backend under
+``$XDG_CACHE_HOME/githeat`` (``~/.cache/githeat`` by default) as a zlib
+compressed pickle, together with the HEAD they were built from. On the next
+run only the commits between that tip and the current HEAD are read from git,
+and commits that fell out of the one year window are dropped. If the cached
+tip is no longer an ancestor of HEAD (force-push, rebase, reset) the entry is
+rebuilt from scratch.
+
+"""
+from __future__ import absolute_import
+
+import datetime
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+
+from git.exc import GitCommandError
+
+from . import gitlog
+from .core import logger
+from .store import CommitStore
+
+__all__ = "Cache",
+
+CACHE_VERSION = 3
+
+
+def cache_dir():
+    """
+    Returns the directory where cache files are stored
+    """
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(root, 'githeat')
+
+
+class Cache:
+
+    def __init__(self, git_repo, author=None, grep=None, backend='git',
+                 directory=None):
+        self.git_repo = git_repo
+        self.author = author
+        self.grep = grep
+        self.backend = backend  # records read by git log and odb aren't mixed
+        self.directory = directory or cache_dir()
+        self.path = None
+        self.head = None
+
+        self._resolve()
+
+    def _resolve(self):
+        """
+        Finds the repository top level and HEAD, which identify the cache entry
+        """
+        try:
+            toplevel, self.head = self.git_repo.rev_parse('--show-toplevel',
+                                                          'HEAD').split('\n')
+        except (GitCommandError, ValueError):  # e.g. no commits yet
+            logger.info("commit cache disabled, can't resolve HEAD")
+            return
+
+        key = repr((CACHE_VERSION, toplevel, self.author, self.grep, self.backend))
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        self.path = os.path.join(self.directory, name)
+
+    def commits(self, read_log, today=None):
+        """
+        Returns the commits within the window, reading from git only the commits
+        that are not cached yet
+
+        :param read_log: callable taking a revision range (None for HEAD) and
+                         returning an iterable of commit records
+        :param today: day the window ends on, defaults to today
+        :return: CommitStore
+        """
+        commits = CommitStore()
+        if not self.path:
+            commits.extend(read_log(None))
+            return commits
+
+        entry = self.load()
+        if entry is None:
+            commits.extend(read_log(None))
+        elif entry['tip'] == self.head:
+            commits = entry['commits']
+        elif self._is_ancestor(entry['tip']):
+            revision = '{}..{}'.format(entry['tip'], self.head)
+            logger.debug("updating commit cache with {}".format(revision))
+            commits.extend(read_log(revision))
+            commits.update(entry['commits'])
+        else:
+            logger.debug("history was rewritten, rebuilding commit cache")
+            commits.extend(read_log(None))
+
+        since = gitlog.since_date(today or datetime.date.today()).toordinal()
+        expired = bool(commits.days) and min(commits.days) < since
+        if expired:
+            commits = commits.select(lambda day: day >= since)
+
+        if entry is None or entry['tip'] != self.head or expired:
+            self.save(commits)
+        return commits
+
+    def load(self):
+        """
+        Returns the cached entry as a dict with 'tip' and 'commits' keys, or
+        None if there is no readable entry
+        """
+        if not self.path:
+            return None
+        try:
+            with open(self.path, 'rb') as stream:
+                entry = pickle.loads(zlib.decompress(stream.read()))
+        except (IOError, OSError, EOFError, ValueError, AttributeError,
+                ImportError, zlib.error, pickle.UnpicklingError):
+            return None
+
+        logger.debug("using commit cache {}".format(self.path))
+        return entry
+
+    def save(self, commits):
+        """
+        Stores commits built from the current HEAD, replacing any existing entry
+        atomically
+
+        :param commits: CommitStore
+        """
+        if not self.path:
+            return
+        entry = {'tip': self.head, 'commits': commits}
+        data = zlib.compress(pickle.dumps(entry, pickle.HIGHEST_PROTOCOL))
+        tmp_path = None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as stream:
+                stream.write(data)
+            os.rename(tmp_path, self.path)
+        except (IOError, OSError) as e:
+            logger.warning("can't write commit cache: {}".format(e))
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _is_ancestor(self, tip):
+        """
+        Checks if the cached tip is still reachable from HEAD
+        """
+        try:
+            self.git_repo.merge_base('--is-ancestor', tip, self.head)
+        except GitCommandError:  # not an ancestor, or tip no longer exists
+            return False
+        return True
@@ -0,0 +1,79 @@
+""" Daily contribution counting.
+
+Commits are counted per day from their day ordinals (`date.toordinal()`), over
+a window of consecutive days. When NumPy is installed the counts come from a
+single `bincount` over the ordinals and day/month filters are boolean masks
+over the window; otherwise the same results are computed in pure Python.
+
+"""
+from __future__ import absolute_import
+
+from collections import Counter
+import datetime
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+__all__ = "count_by_day", "filter_counts"
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def count_by_day(day_ordinals, first, last):
+    """
+    Counts commits on each day from first to last
+
+    :param day_ordinals: sequence of commit day ordinals, e.g. CommitStore.days
+    :param first: ordinal of the first day of the window
+    :param last: ordinal of the last day of the window
+    :return: list of counts, one per day of the window
+    """
+    size = last - first + 1
+    if np is not None:
+        days = np.asarray(day_ordinals, dtype=np.int64)
+        days = days[(days >= first) & (days <= last)]
+        return np.bincount(days - first, minlength=size).tolist()
+
+    counts = [0] * size
+    for day, count in Counter(day_ordinals).items():
+        if first <= day <= last:
+            counts[day - first] = count
+    return counts
+
+
+def filter_counts(counts, first, weekdays=None, months=None):
+    """
+    Zeroes the counts of days that are not in the given weekdays or months
+
+    :param counts: list of counts, one per day starting at first
+    :param first: ordinal of the first day
+    :param weekdays: indices of days to keep, 0 being Sunday, or None for all.
+                     Ordinal 7 is a Sunday, so a day's index is its ordinal % 7
+    :param months: first days (datetime.date) of months to keep, or None for all
+    :return: new list of counts
+    """
+    if not weekdays and not months:
+        return list(counts)
+
+    if np is not None:
+        ordinals = np.arange(first, first + len(counts))
+        keep = np.ones(len(counts), dtype=bool)
+        if weekdays:
+            keep &= np.isin(ordinals % 7, list(weekdays))
+        if months:
+            day_months = (ordinals - _EPOCH_ORDINAL).astype('datetime64[D]')\
+                .astype('datetime64[M]')
+            keep &= np.isin(day_months, np.array(list(months), dtype='datetime64[M]'))
+        return np.where(keep, counts, 0).tolist()
+
+    months = set(months or [])
+    filtered = []
+    for ordinal, count in enumerate(counts, first):
+        if weekdays and ordinal % 7 not in weekdays:
+            count = 0
+        elif months and datetime.date.fromordinal(ordinal).replace(day=1) not in months:
+            count = 0
+        filtered.append(count)
+    return filtered
@@ -1,21 +1,27 @@
 #!/usr/bin/env python
 from __future__ import print_function
 
-from collections import Counter
+from array import array
 from collections import defaultdict
 import datetime
-import itertools
 from itertools import cycle
 import os
+import struct
 import sys
-
-from xtermcolor import colorize
-
-from dateutil.parser import parse as parse_date
-from dateutil.relativedelta import relativedelta
-
+import time
+import zlib
+
+from . import contributions
+from . import gitlog
+from . import multirepo
+from . import odb
+from .cache import Cache
 from .core import logger
+from .palette import get_palette
+from .store import CommitStore
+from .store import LazyCommitStore
 from .util import helpers
+from .util.terminal import terminal_columns
 
 DAYS = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
 
@@ -28,49 +34,19 @@ BLOCK_THICK = '   '
 BLOCK_REG = '  '
 BLOCK_THIN = ' '
 
-
-class Commit:
-    def __init__(self, abbr_commit_hash, date, author, author_email, subject):
-        self.abbr_commit_hash = abbr_commit_hash
-        self.date = date
-        self.author = author
-        self.author_email = author_email
-        self.subject = subject
-
-    def __cmp__(self, other):
-        if hasattr(other, 'date'):
-            return self.date.__cmp__(other.date)
-
-    def __str__(self):
-        return "{} on {}".format(self.author, self.date)
-
-    def __repr__(self):
-        return self.__str__()
+#  commits read between two progress reports, see Githeat.read_commits
+PROGRESS_BATCH = 2000
 
 
 class Githeat:
 
     class _Column:
+        """
+        One week of a _Matrix, as a list of [date, level] cells
+        """
 
-        def __init__(self, width, full_empty_col=False):
-            if full_empty_col:
-                self.col = [[None, width]] * 7
-            else:
-                self.col = []
-
-            self.width = width
-
-        def append(self, val):
-            if len(self.col) >= 7:
-                raise ValueError("Can't add more than 7 days")
-            self.col.append(val)
-
-        def fill(self):
-            while len(self.col) != 7:
-                self.col += [[None, self.width]]
-
-        def fill_by(self, first_x):
-            self.col += [[None, self.width]] * first_x
+        def __init__(self, col):
+            self.col = col
 
         def __len__(self):
             return len(self.col)
@@ -87,11 +63,90 @@ class Githeat:
             else:
                 return "Empty col"
 
+    class _Matrix:
+        """
+        Contribution graph as a grid of 7 rows (days) by N columns (weeks)
+
+        Cells are stored column after column in two arrays: the day ordinal of each
+        cell and its intensity level, both EMPTY for gaps. Colors are only applied
+        when the matrix is painted.
+        """
+        EMPTY = -1
+
+        def __init__(self):
+            self.days = array('l')
+            self.levels = array('b')
+            self._open_column = False  # a column was started but has no cells yet
+
+        def append(self, day, level):
+            """
+            Adds a cell below the last one, starting a new column after 7 cells
+            """
+            self.days.append(day.toordinal())
+            self.levels.append(level)
+            self._open_column = False
+
+        def fill_by(self, first_x):
+            """
+            Adds first_x empty cells
+            """
+            if first_x:
+                self.days.extend([self.EMPTY] * first_x)
+                self.levels.extend([self.EMPTY] * first_x)
+                self._open_column = False
+
+        def fill(self):
+            """
+            Fills the last column with empty cells
+            """
+            if self._open_column:
+                self.fill_by(7)
+            else:
+                self.fill_by(-len(self.days) % 7)
+
+        def new_column(self):
+            """
+            Ends the last column, the next cell goes at the top of a new one
+            """
+            self.fill()
+            self._open_column = True
+
+        def day(self, week, day_num):
+            """
+            Returns the date in a cell, or None if it is empty
+            """
+            ordinal = self.days[week * 7 + day_num]
+            return None if ordinal == self.EMPTY else datetime.date.fromordinal(ordinal)
+
+        def level(self, week, day_num):
+            """
+            Returns the intensity level of a cell, or EMPTY
+            """
+            return self.levels[week * 7 + day_num]
+
+        def __len__(self):
+            return (len(self.days) + 6) // 7 + (1 if self._open_column else 0)
+
+        def __getitem__(self, week):
+            if week < 0:
+                week += len(self)
+            if not 0 <= week < len(self):
+                raise IndexError("matrix week out of range")
+            cells = min(7, len(self.days) - week * 7)
+            return Githeat._Column([[self.day(week, i), self.level(week, i)]
+                                    for i in range(max(cells, 0))])
+
+        def __iter__(self):
+            for week in range(len(self)):
+                yield self[week]
+
     def __init__(self, git_repo,
                  gtype='block', width='reg', days=[], color='grass', colors=[],
                  stat=False, stat_number=5, separate=True, month_merge=False,
                  legend=False, author=None, grep=None, config=None,
-                 logging_level="CRITICAL"
+                 logging_level="CRITICAL", cache=False, scale='linear',
+                 columns=None, repos=None, collector='process', jobs=None,
+                 backend='git', lazy=False
                  ):
         self.git_repo = git_repo
 
@@ -115,11 +170,23 @@ class Githeat:
         self.hide_legend = legend
         self.author = author
         self.grep = grep
+        self.cache = cache
+        self.scale = scale or 'linear'
+        self.columns = columns  # terminal width override
+        self.repos = repos  # paths of repositories to aggregate instead of git_repo
+        self.collector = collector or 'process'  # how repos are read, see parse_commits
+        self.jobs = jobs  # repositories read at once
+        self.backend = backend or 'git'  # 'git' log subprocess or 'odb' reader
+        self.lazy = lazy  # read commit days first, and commits when they're shown
+        self.logging_level = logging_level
 
         self.config = config
 
         self.commits_db = None
+        self._top_committers = {}  # (day, n) -> top committers, see get_top_committers
+        self._top_committers_db = None  # commits_db they were counted in
         self.daily_contribution_map = None
+        self.daily_totals = None  # unfiltered commits per day of the map
 
         if width:
             if width == 'thick':
@@ -163,45 +230,168 @@ class Githeat:
         self.colors = next(self.colors_iterator)
         return self.colors
 
+    def get_palette(self):
+        """
+        Returns the pre-rendered blocks for the current colors and width
+        """
+        return get_palette(self.colors, self.width)
+
+    def collect_commits(self, progress=None):
+        """
+        Returns the commits of the 'git_repo' git log, streamed into a CommitStore
+        as they are read
+
+        :param progress: see `read_commits`
+        """
+        read_log = self.read_log
+        if progress:
+            read_log = lambda revision=None: _report_days(
+                self.read_log(revision), lambda record: record[1].toordinal(),
+                progress)
+        if self.cache:
+            commit_cache = Cache(self.git_repo, author=self.author, grep=self.grep,
+                                 backend=self.backend)
+            return commit_cache.commits(read_log)
+        commits = CommitStore()  # holds commits by date as key
+        commits.extend(read_log())
+        return commits
+
+    def read_commits(self, progress=None):
+        """
+        Reads the commits of 'git_repo', or of every repository in 'repos'. When
+        lazy, only the day of each commit is read now
+
+        :param progress: callable taking a list of day ordinals, called for each
+                         batch of commits read from 'git_repo' (commits read from
+                         the cache or from 'repos' aren't reported)
+        :return: CommitStore, or LazyCommitStore when lazy
+        """
+        if self.repos and self.collector == 'asyncio':
+            #  needs Python 3.7+, so only imported when asked for
+            from . import asynclog
+            return asynclog.collect(self.repos, author=self.author, grep=self.grep,
+                                    concurrency=self.jobs)
+        elif self.repos:
+            return multirepo.collect(self.repos, multirepo.repo_commits,
+                                     max_workers=self.jobs,
+                                     author=self.author, grep=self.grep,
+                                     cache=self.cache, backend=self.backend,
+                                     logging_level=self.logging_level)
+        elif self.lazy:
+            commits = LazyCommitStore(self.read_log_between)
+            days = self.read_commit_days()
+            if progress:
+                days = _report_days(days, int, progress)
+            commits.days.extend(days)
+            return commits
+        return self.collect_commits(progress)
+
+    def day_filter(self):
+        """
+        Returns a callable taking a day ordinal that keeps the days in 'days', or
+        None if every day is shown
+        """
+        if not self.days:
+            return None
+        days = set(self.days)  # a lazy store keeps filtering with it
+        return lambda day: DAYS[day % 7] in days
+
+    def preview_commits(self):
+        """
+        Returns an empty store to add the days of commits to while they are read
+        in the background, which reads a day's commits from git when it's shown.
+        See `loader.Loader`
+        """
+        return LazyCommitStore(self.read_log_between, self.day_filter())
+
     def parse_commits(self):
         """
-        Parses the 'git_repo' git log
+        Parses the git log of 'git_repo', or of every repository in 'repos', into
+        commits_db, which is left empty if no contribution is found. When lazy,
+        only the day of each commit is read now
 
         """
         logger.debug("parsing git log")
-        delimiter = '<githeat_delimeter>'
-        git_log_args = ["--since=1 year 7 days",
-                        "--pretty=format:'%h{0}%ci{0}%an{0}%ae{0}%s'".format(delimiter),
-                        "--date=local"]
-        if self.author:
-            git_log_args.append('--author={}'.format(self.author))
-        if self.grep:
-            git_log_args.append("--grep={}".format(self.grep))
-
-        last_year_log_dates = self.git_repo.log(git_log_args)
-        raw_commits = last_year_log_dates.replace("'", '').split("\n")
-        self.commits_db = defaultdict(list)  # holds commits by date as key
-
-        if raw_commits:  # check if there exists any contribution
-            for rc in raw_commits:
-                [abbr_commit_hash, exact_date_and_time, author, author_email, subject]\
-                    = helpers.remove_accents(rc).split(delimiter)
-                # author = author.decode('ascii', 'ignore')
-                exact_date_and_time = parse_date(exact_date_and_time)
-
-                #  if user specified what days to show, skip if not included
-                if self.days and exact_date_and_time.strftime("%A") not in self.days:
-                    continue
+        commits = self.read_commits()
 
-                commit = Commit(abbr_commit_hash,
-                                exact_date_and_time,
-                                author,
-                                author_email,
-                                subject)
-                self.commits_db[exact_date_and_time.date()].append(commit)
-        else:
-            print('No contribution found')
-            sys.exit(0)
+        #  if user specified what days to show, skip commits from other days
+        day_filter = self.day_filter()
+        if day_filter:
+            commits = commits.select(day_filter)
+        self.commits_db = commits
+        self.daily_totals = None
+
+    def read_log(self, revision=None):
+        """
+        Returns an iterator of commit records from the 'git_repo' git log
+
+        :param revision: revision range to read, defaults to HEAD
+        """
+        #  walking the whole window through the object database is slower than
+        #  git log, commit-graph or not, so it only reads the new commits of a
+        #  cache update
+        if self.backend == 'odb' and revision:
+            records = self.read_objects(revision)
+            if records is not None:
+                return iter(records)
+        return self.read_git_log(revision)
+
+    def read_git_log(self, revision=None):
+        """
+        Yields commit records from a `git log` subprocess as they are read
+
+        :param revision: revision range to read, defaults to HEAD
+        """
+        git_log_args = gitlog.log_args(author=self.author, grep=self.grep,
+                                       revision=revision)
+        for record in gitlog.iter_log_records(self.git_repo, git_log_args):
+            yield gitlog.parse_commit(record)
+
+    def read_commit_days(self):
+        """
+        Yields the day ordinal of each commit from a `git log` listing only
+        committer dates, much less output than the full log
+
+        """
+        git_log_args = gitlog.log_args(author=self.author, grep=self.grep,
+                                       log_format=gitlog.DAY_FORMAT)
+        for record in gitlog.iter_log_records(self.git_repo, git_log_args):
+            yield gitlog.parse_commit_day(record)
+
+    def read_log_between(self, since=None, until=None):
+        """
+        Yields commit records committed between two dates from the git log
+
+        :param since: first datetime.date, None for the start of the window
+        :param until: datetime.date after the last one, None for today
+        """
+        git_log_args = gitlog.log_args(
+            author=self.author, grep=self.grep,
+            since=gitlog.approxidate(since) if since else gitlog.SINCE,
+            until=gitlog.approxidate(until) if until else None)
+        for record in gitlog.iter_log_records(self.git_repo, git_log_args):
+            yield gitlog.parse_commit(record)
+
+    def read_objects(self, revision=None):
+        """
+        Reads commit records straight from the object database
+
+        :param revision: revision range to read, defaults to HEAD
+        :return: list of records, or None if the repository isn't supported and
+                 git log has to be used instead
+        """
+        since = gitlog.since_date(datetime.datetime.now())
+        try:
+            database = odb.ObjectDatabase(self.git_repo.working_dir)
+            #  read everything up front, so a failure part way through can still
+            #  fall back to git log
+            return list(database.log(since=time.mktime(since.timetuple()),
+                                     revision=revision, author=self.author,
+                                     grep=self.grep))
+        except (odb.UnsupportedRepository, zlib.error, struct.error, ValueError,
+                IndexError, KeyError, TypeError, IOError, OSError) as e:
+            logger.info("reading git log instead of objects: {}".format(e))
+            return None
 
     def init_daily_contribution_map(self):
         """
@@ -212,7 +402,7 @@ class Githeat:
         self.daily_contribution_map = defaultdict(float)
 
         today = datetime.date.today()
-        last_year = today - relativedelta(years=1, days=7)
+        last_year = gitlog.since_date(today)
 
         #  iterate through from last year date + 7 days and init dict with zeros
         delta = today - last_year
@@ -234,6 +424,7 @@ class Githeat:
             self.daily_contribution_map[current_day] = 0.0
 
         self.display_months_toggle = [False] * len(self.months)
+        self.daily_totals = None
 
     def reset_daily_contribution_map(self):
         """
@@ -247,33 +438,34 @@ class Githeat:
     def compute_daily_contribution_map(self):
         """
         Compute how many commits were committed on each day
+
+        Commits are only counted the first time, after that filtering by days or
+        months just masks the unfiltered daily totals
         """
         logger.debug("Computing contributions")
 
-        # update dict with contributions
-        for commits_on_day in self.commits_db:
-            for commit in self.commits_db[commits_on_day]:
-
-                #  if user specified what days to show, skip commit if from that day
-                if self.days and commit.date.strftime("%A") not in self.days:
-                    continue
-
-                #  if user specified what months to show, skip commit from that month
-                if self.display_months and datetime.date(commit.date.year,
-                                                         commit.date.month,
-                                                         1) not in self.display_months:
-                    continue
+        first = min(self.daily_contribution_map).toordinal()
+        if self.daily_totals is None:
+            last = max(self.daily_contribution_map).toordinal()
+            self.daily_totals = contributions.count_by_day(self.commits_db.days,
+                                                           first, last)
+        counts = self.daily_totals
 
-                contribution_day = datetime.date(commit.date.year,
-                                                 commit.date.month,
-                                                 commit.date.day)
+        #  if user specified what days or months to show, skip commits from others
+        weekdays = [DAYS.index(d) for d in self.days or []]
+        counts = contributions.filter_counts(counts, first, weekdays,
+                                             self.display_months)
 
+        # update dict with contributions
+        for contribution_day, count in enumerate(counts, first):
+            if count:
+                contribution_day = datetime.date.fromordinal(contribution_day)
                 if contribution_day in self.daily_contribution_map:
-                    self.daily_contribution_map[contribution_day] += 1.0
+                    self.daily_contribution_map[contribution_day] += count
 
     def normalize_daily_contribution_map(self, x1=0, x2=5):
         """
-        Normalizes daily contribution to values between [x1, x2]
+        Normalizes daily contribution to values between [x1, x2] using self.scale
         Default is set to [0, 5] because we have 6 colors
         :param x2: range to
         :param x1: range from
@@ -282,7 +474,7 @@ class Githeat:
 
         # normalize values to be between [x1, x2]
         self.daily_contribution_map = helpers.normalize_dict(self.daily_contribution_map,
-                                                             x1, x2)
+                                                             x1, x2, self.scale)
 
     def recompute_daily_contribution_map(self):
         """
@@ -329,152 +521,202 @@ class Githeat:
 
     def compute_graph_matrix(self):
         """
-        Compute and return contribution graph matrix
+        Compute and return contribution graph matrix of intensity levels
 
         """
-        logger.debug("Printing graph")
+        logger.debug("Computing graph")
 
         sorted_normalized_daily_contribution = sorted(self.daily_contribution_map)
-        matrix = []
+        matrix = self._Matrix()
         first_day = sorted_normalized_daily_contribution[0]
-        if first_day.strftime("%A") != "Sunday":
-            c = self._Column(self.width)
-            d = first_day - datetime.timedelta(days=1)
-            while d.strftime("%A") != "Saturday":
-                d = d - datetime.timedelta(days=1)
-                c.append([None, self.width])
-            matrix.append(c)
-        else:
-            new_column = self._Column(self.width)
-            matrix.append(new_column)
+        #  start on a Sunday, leave the days before first_day empty
+        matrix.fill_by(DAYS.index(first_day.strftime("%A")))
 
         for current_day in sorted_normalized_daily_contribution:
-            last_week_col = matrix[-1]
             day_contribution_color_index = int(self.daily_contribution_map[current_day])
-            color = self.colors[day_contribution_color_index]
-
-            try:
-                last_week_col.append([current_day, colorize(self.width,
-                                                            ansi=0,
-                                                            ansi_bg=color)])
-
-            except ValueError:  # column (e.g. week) has ended
-                new_column = self._Column(self.width)
-                matrix.append(new_column)
-                last_week_col = matrix[-1]
-                last_week_col.append([current_day, colorize(self.width,
-                                                            ansi=0,
-                                                            ansi_bg=color)])
+            matrix.append(current_day, day_contribution_color_index)
 
             next_day = current_day + datetime.timedelta(days=1)
             if next_day.month != current_day.month:
                 #  if the column we're at isn't 7 days yet, fill it with empty blocks
-                last_week_col.fill()
+                matrix.new_column()
 
                 #  make new empty col to separate months
-                matrix.append(self._Column(self.width, full_empty_col=True))
-
-                matrix.append(self._Column(self.width))
-                last_week_col = matrix[-1]  # update to the latest column
+                matrix.fill()
+                matrix.new_column()
 
                 #  if next_day (which is first day of new month) starts in middle of the
                 #  week, prepend empty blocks in the column before inserting 'next day'
                 next_day_num = DAYS.index(next_day.strftime("%A"))
-                last_week_col.fill_by(next_day_num)
+                matrix.fill_by(next_day_num)
 
         # make sure that the most current week (last col of matrix) col is of size 7,
         #  so fill it if it's not
-        matrix[-1].fill()
+        matrix.fill()
 
         return matrix
 
-    def print_graph(self, matrix):
+    def paint(self, level):
         """
-        Prints graph matrix
+        Returns the block to draw for an intensity level, in the current colors
+        """
+        if level == self._Matrix.EMPTY:
+            return self.width
+        return self.get_palette()[level]
 
+    def format_graph(self, matrix):
         """
+        Returns graph matrix as a string
+
+        """
+        blocks = self.get_palette()
+        separation = self.block_separation_show
+        rows = []
         #  for each day of the week
         for i in range(7):
+            row = []
             #  for the week column in the matrix
-            for week in matrix:
+            for week in range(len(matrix)):
+                level = matrix.level(week, i)
 
                 if self.month_merge:
-                    #  check if value in that week is just empty spaces and not colorize
-                    if week.col[i][1] == self.width:
+                    #  skip empty cells
+                    if level == matrix.EMPTY:
                         continue
 
-                print("{}{}".format(week.col[i][1], self.block_separation_show), end="")
-            print("{}".format("\n" if self.block_separation_show else ''))
+                row.append(self.width if level == matrix.EMPTY else blocks[level])
+                row.append(separation)
+            row.append("\n\n" if separation else "\n")
+            rows.append(''.join(row))
+        return ''.join(rows)
 
-    def print_inline(self):
+    def print_graph(self, matrix):
         """
-        Prints a whole year of contribution in inline form
+        Prints graph matrix
 
         """
-        logger.debug("Printing inline")
+        sys.stdout.write(self.format_graph(matrix))
 
-        sorted_normalized_daily_contribution = sorted(self.daily_contribution_map)
-        for current_day in sorted_normalized_daily_contribution:
+    def format_inline(self):
+        """
+        Returns a whole year of contribution in inline form as a string
+
+        """
+        blocks = self.get_palette()
+        lines = []
+        for current_day in sorted(self.daily_contribution_map):
             norm_day_contribution = int(self.daily_contribution_map[current_day])
-            color = self.colors[norm_day_contribution]
-            print(colorize(self.width, ansi=0, ansi_bg=color),
-                  end=" {}{}".format(current_day.strftime("%b %d, %Y"), '\n')
-                  )
+            lines.append("{} {}\n".format(blocks[norm_day_contribution],
+                                          current_day.strftime("%b %d, %Y")))
+        return ''.join(lines)
 
-    def get_top_n_commiters(self, commits_list, n=5, normailze_values=False):
+    def print_inline(self):
         """
-        Returns a list of names of the top n commiters from a list of commits
+        Prints a whole year of contribution in inline form
+
         """
-        if not commits_list:
-            return None
-        commits_authors = [c.author for c in commits_list]
-        counter = Counter(commits_authors)
-        top_n = counter.most_common(n)
-        if normailze_values:
+        logger.debug("Printing inline")
+        sys.stdout.write(self.format_inline())
+
+    def get_top_committers(self, day, n=5):
+        """
+        Returns a list of (name, commits normalized to [1, 5]) of the top n
+        committers on day, or None if there are none. Each day is counted once
+        and remembered until commits_db is replaced; filtering by days or months
+        doesn't change the commits of a day
+        """
+        if self._top_committers_db is not self.commits_db:
+            self._top_committers = {}
+            self._top_committers_db = self.commits_db
+        key = (day, n)
+        try:
+            return self._top_committers[key]
+        except KeyError:
+            pass
+        top_n = self.commits_db.top_authors(n, day) or None
+        if top_n:
             top_n = helpers.normalize_tuple_list(top_n, 1, 5)
+        self._top_committers[key] = top_n
         return top_n
 
-    def print_stats(self):
+    def format_stats(self):
         """
-        Prints contribution statistics
+        Returns contribution statistics as a string
 
         """
-        logger.debug("Printing stats")
         n = self.stat_number if self.stat_number else 5
 
-        top_n = self.get_top_n_commiters(
-                list(itertools.chain.from_iterable(self.commits_db.values())),
-                n
-        )
+        top_n = self.commits_db.top_authors(n)
 
-        if top_n:
-            print("Top {} committers:".format(n))
-            for idx, info in enumerate(top_n):
-                print("{}. {}: {}".format(idx + 1, info[0], info[1]))
+        if not top_n:
+            return ''
+        lines = ["Top {} committers:\n".format(n)]
+        for idx, info in enumerate(top_n):
+            lines.append("{}. {}: {}\n".format(idx + 1, info[0], info[1]))
+        return ''.join(lines)
 
-    def run(self):
+    def print_stats(self):
         """
-        Githeat execution logic
+        Prints contribution statistics
+
+        """
+        logger.debug("Printing stats")
+        sys.stdout.write(self.format_stats())
+
+    def render_to_string(self, columns=None):
+        """
+        Parses commits and returns the whole heatmap output as a string
 
+        :param columns: terminal width, the graph is replaced by a warning if it
+                        doesn't fit. None to skip the check
         """
         self.parse_commits()
+        if not self.commits_db:  # check if there exists any contribution
+            return "No contribution found\n"
         self.init_daily_contribution_map()
         self.compute_daily_contribution_map()
         self.normalize_daily_contribution_map()
 
         if self.gtype == 'inline':
-            self.print_inline()
+            output = [self.format_inline()]
         else:
             matrix = self.compute_graph_matrix()
-            _, width = os.popen('stty size', 'r').read().split()
-            matrix_width = self.get_matrix_width(matrix)
-            if matrix_width > int(width):
-                print("Your terminal width is smaller than the heatmap. Please "
-                      "consider using the --width {thin, reg, thick},  resizing your "
-                      "terminal, or merging months by including --month-merge")
-                return
-            self.print_graph(matrix)
+            if columns is not None and self.get_matrix_width(matrix) > columns:
+                return ("Your terminal width is smaller than the heatmap. Please "
+                        "consider using the --width {thin, reg, thick},  resizing your "
+                        "terminal, or merging months by including --month-merge\n")
+            output = [self.format_graph(matrix)]
 
         if self.stat:
-            print()
-            self.print_stats()
+            output.append("\n")
+            output.append(self.format_stats())
+        return ''.join(output)
+
+    def run(self):
+        """
+        Githeat execution logic
+
+        """
+        columns = None
+        if self.gtype != 'inline':
+            columns = terminal_columns(self.columns)
+        sys.stdout.write(self.render_to_string(columns))
+
+
+def _report_days(items, day_of, progress, batch_size=PROGRESS_BATCH):
+    """
+    Passes items through, calling progress with the day ordinals of each batch
+
+    :param items: iterable of commit records or day ordinals
+    :param day_of: callable returning the day ordinal of an item
+    :param progress: callable taking a list of day ordinals
+    """
+    days = []
+    for item in items:
+        days.append(day_of(item))
+        if len(days) == batch_size:
+            progress(days)
+            days = []
+        yield item
+    if days:
+        progress(days)
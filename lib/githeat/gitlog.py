@@ -0,0 +1,202 @@
+""" Streaming access to the git log.
+
+Commits are requested from git as NUL separated records (``git log -z``) whose
+fields are separated by the ASCII unit separator. The output is read in fixed
+size chunks and each record is yielded as soon as it is complete, so the whole
+log never has to be held in memory.
+
+"""
+from __future__ import absolute_import
+
+import datetime
+
+from dateutil.parser import parse as parse_date
+from dateutil.relativedelta import relativedelta
+from dateutil.tz import tzoffset
+
+from .util import helpers
+
+__all__ = ("log_args", "approxidate", "since_date", "iter_log_records",
+           "iter_records", "split_records", "parse_record", "parse_commit",
+           "parse_commit_day", "parse_commit_date")
+
+FIELD_SEPARATOR = u'\x1f'
+RECORD_SEPARATOR = b'\x00'
+
+#  abbreviated hash, committer date in strict ISO 8601, author name, author email,
+#  subject
+LOG_FORMAT = "%h%x1f%cI%x1f%an%x1f%ae%x1f%s"
+
+#  committer date only, enough to count commits per day. Strict ISO rather than
+#  %ct, as days are counted in the committer's timezone
+DAY_FORMAT = "%cI"
+
+SINCE = "1 year 7 days"
+
+CHUNK_SIZE = 64 * 1024
+
+#  tzinfo by '+hh:mm' offset, shared by all commits in that timezone
+_TIMEZONES = {}
+
+
+def since_date(today):
+    """
+    Returns the first day covered by `SINCE` when counting back from today
+    """
+    return today - relativedelta(years=1, days=7)
+
+
+def log_args(author=None, grep=None, since=SINCE, revision=None, until=None,
+             log_format=LOG_FORMAT):
+    """
+    Returns the `git log` arguments used to list commits
+
+    :param author: filter by author regex
+    :param grep: filter by keywords in commit messages
+    :param since: how far back to go, in git's approxidate format
+    :param revision: revision range to list, e.g. 'a1b2c3..HEAD'
+    :param until: skip commits after this, in git's approxidate format
+    :param log_format: pretty format of each record, e.g. `DAY_FORMAT`
+    :return: list of arguments
+    """
+    args = ["-z",
+            "--pretty=format:{}".format(log_format),
+            "--date=local"]
+    if since:
+        args.insert(0, "--since={}".format(since))
+    if until:
+        args.insert(1, "--until={}".format(until))
+    if author:
+        args.append('--author={}'.format(author))
+    if grep:
+        args.append("--grep={}".format(grep))
+    if revision:
+        args.append(revision)
+    return args
+
+
+def approxidate(day):
+    """
+    Returns the start of day in a form git's --since and --until understand.
+    A bare date would be taken at the current time of day
+    """
+    return day.strftime("%Y-%m-%d 00:00:00")
+
+
+def iter_records(stream, chunk_size=CHUNK_SIZE):
+    """
+    Yields raw records from a NUL separated byte stream as they arrive
+
+    :param stream: file-like object opened in binary mode
+    :param chunk_size: number of bytes to read at a time
+    :return: generator of bytes records
+    """
+    pending = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records, pending = split_records(pending, chunk)
+        for record in records:
+            yield record
+    if pending:
+        yield pending
+
+
+def split_records(pending, chunk):
+    """
+    Splits the complete records out of newly read bytes
+
+    :param pending: incomplete record left over from the previous chunk
+    :param chunk: bytes just read
+    :return: tuple of (list of complete bytes records, new pending bytes)
+    """
+    records = (pending + chunk).split(RECORD_SEPARATOR)
+    pending = records.pop()  # last one may be incomplete
+    return [record for record in records if record], pending
+
+
+def iter_log_records(git_repo, args, chunk_size=CHUNK_SIZE):
+    """
+    Runs `git log` and yields its raw records while the process is running
+
+    :param git_repo: git.Git instance
+    :param args: `git log` arguments, see `log_args`
+    :param chunk_size: number of bytes to read at a time
+    :return: generator of bytes records
+    """
+    process = git_repo.log(args, as_process=True)
+    try:
+        for record in iter_records(process.stdout, chunk_size):
+            yield record
+    finally:
+        process.stdout.close()
+    process.wait()  # raises GitCommandError if git failed
+
+
+def parse_record(record):
+    """
+    Splits a raw record into its fields
+
+    :param record: bytes record as produced by `iter_records`
+    :return: list of [abbr_commit_hash, date, author, author_email, subject]
+    """
+    abbr_commit_hash, date, author, author_email, subject = \
+        record.decode('utf-8', 'replace').split(FIELD_SEPARATOR)
+    return [abbr_commit_hash,
+            date,
+            helpers.remove_accents(author),
+            author_email,
+            helpers.remove_accents(subject)]
+
+
+def parse_commit(record):
+    """
+    Parses a raw record into the fields taken by `CommitStore.append`
+
+    :param record: bytes record as produced by `iter_records`
+    :return: list of [abbr_commit_hash, date, author, author_email, subject]
+             with date parsed by `parse_commit_date`
+    """
+    fields = parse_record(record)
+    fields[1] = parse_commit_date(fields[1])
+    return fields
+
+
+def parse_commit_day(record):
+    """
+    Returns the day ordinal of a `DAY_FORMAT` record, in the committer's timezone
+
+    :param record: bytes record as produced by `iter_records`
+    """
+    if len(record) == 25:
+        return datetime.date(int(record[0:4]), int(record[5:7]),
+                             int(record[8:10])).toordinal()
+    return parse_commit_date(record.decode('utf-8')).toordinal()
+
+
+def parse_commit_date(value):
+    """
+    Parses a committer date into a timezone aware datetime
+
+    Dates in the fixed width 'YYYY-MM-DDTHH:MM:SS+hh:mm' form requested by
+    `LOG_FORMAT` are sliced directly, anything else falls back to dateutil's
+    generic parser.
+
+    :param value: date string
+    :return: datetime in the committer's timezone
+    """
+    if len(value) != 25 or value[10] != 'T':
+        return parse_date(value)
+
+    offset = value[19:]
+    tz = _TIMEZONES.get(offset)
+    if tz is None:
+        seconds = int(offset[1:3]) * 3600 + int(offset[4:6]) * 60
+        if offset[0] == '-':
+            seconds = -seconds
+        tz = _TIMEZONES[offset] = tzoffset(None, seconds)
+
+    return datetime.datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                             int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                             0, tz)
@@ -8,6 +8,7 @@ from __future__ import print_function
 from argparse import ArgumentParser
 from argparse import ArgumentTypeError
 from argparse import RawDescriptionHelpFormatter
+import collections
 import functools
 import os
 import re
@@ -26,8 +27,13 @@ from . import __version__
 from .core import config
 from .core import logger
 from .githeat import Githeat
+from .loader import Loader
+from .palette import get_palette
 from .util import interactive_navigation as nav
 from .util.interactive_navigation import Cursor
+from .util.scheduler import InputScheduler
+from .util.scheduler import Move
+from .util.screen import ScreenBuffer
 
 if sys.version_info[0] >= 3:
     unicode = str
@@ -42,6 +48,12 @@ ONE_TO_SEVEN_KEYS = [chr(number) for number in range(49, 56)]  # 1 to 7
 Q_TO_QUOTES_KEYS = ["q", "w", "e", "r", "t", "y", "u", "i", "o", "p", "[", "]", "\\", "'"]
 QUIT_KEYS = [chr(27), chr(3)]  # esc, ^c keys
 
+#  seconds between repaints while commits are loading
+LOADING_REFRESH = 0.1
+
+#  formatted lines of commits kept while they're scrolled through
+COMMIT_ROWS_CACHE = 512
+
 
 def _cmdline(argv=None):
     """ Parse command line arguments.
@@ -105,6 +117,10 @@ def _cmdline(argv=None):
                         choices=['grass', 'fire', 'sky'],
                         help='Choose type of coloring you want for your graph')
 
+    parser.add_argument('--scale',
+                        choices=['linear', 'log', 'quantile'],
+                        help='Choose how daily contributions are mapped to colors')
+
     parser.add_argument('--month-merge',
                         dest='month_merge',
                         action='store_true',
@@ -121,6 +137,24 @@ def _cmdline(argv=None):
     parser.add_argument('--grep', '-g',
                         help='Filter by keywords in commits')
 
+    parser.add_argument('--backend',
+                        choices=['git', 'odb'],
+                        help='Read commits with git log, or read the new commits of a '
+                             'cache update straight from the object database (Python '
+                             '3 only, falls back to git log when unsupported)')
+
+    parser.add_argument('--lazy',
+                        dest='lazy',
+                        action='store_true',
+                        help="Read only commit dates up front, and a day's commits "
+                             "when they are shown. Doesn't use the cache")
+
+    parser.add_argument('--no-cache',
+                        dest='cache',
+                        action='store_false',
+                        help="Don't read or write the commit cache, which is on by "
+                             "default and kept under $XDG_CACHE_HOME/githeat")
+
     parser.add_argument("-v", "--version",
                         action="version",
                         version="githeat {:s}".format(__version__),
@@ -165,27 +199,28 @@ def echo_yx(cursor, text):
 
 
 def redraw(term, screen, start=None, end=None):
-    """Redraw the screen."""
+    """
+    Redraw the screen, or the region of it from start (top left) to end (bottom
+    right), with a single write
+
+    :param term:
+    :param screen: ScreenBuffer
+    :param start: Cursor
+    :param end: Cursor
+    """
+    output = []
     if start is None and end is None:
-        echo(term.clear)
-        start, end = (Cursor(y=min([y for (y, x) in screen or [(0, 0)]]),
-                             x=min([x for (y, x) in screen or [(0, 0)]]),
-                             term=term),
-                      Cursor(y=max([y for (y, x) in screen or [(0, 0)]]),
-                             x=max([x for (y, x) in screen or [(0, 0)]]),
-                             term=term))
-    lastcol, lastrow = -1, -1
-    for row, col in sorted(screen):
-        if start.y <= row <= end.y and start.x <= col <= end.x:
-            if col >= term.width or row >= term.height:
-                # out of bounds
-                continue
-            if not (row == lastrow and col == lastcol + 1):
-                # use cursor movement
-                echo_yx(Cursor(row, col, term), screen[row, col])
-            else:
-                # just write past last one
-                echo(screen[row, col])
+        output.append(term.clear)
+        bounds = screen.bounds() or (0, 0, 0, 0)
+    else:
+        bounds = (start.y, start.x, end.y, end.x)
+    top, left, bottom, right = bounds
+    #  skip what's out of the terminal's bounds
+    bottom = min(bottom, term.height - 1)
+    right = min(right, term.width - 1)
+    for (row, col), value in screen.region(top, left, bottom, right):
+        output.append(term.move(row, col) + value)
+    echo(u''.join(output))
 
 
 def clear(term, start, end):
@@ -196,11 +231,9 @@ def clear(term, start, end):
     :param end:
     :return:
     """
-    if is_within_boundary(0, 0, term.width, term.width, start) or \
-            is_within_boundary(0, 0, term.width, term.width, end) or \
-                    start.x > end.x or start.y > end.y:
+    if not (0 <= start.x <= end.x <= term.width and
+            0 <= start.y <= end.y <= term.height):
         raise ValueError("NOT VALID ")
-        return
 
     x = start.x
     y = start.y
@@ -229,43 +262,18 @@ def top_authors_to_string(top_authors, colors=None):
 
 def print_graph_legend(starting_x, y, width, block_seperation_width, colors, screen,
                        term):
-    for color in colors:
+    for value in get_palette(colors, width).legend:
         c = Cursor(y, starting_x, term)
-        value = colorize(width, ansi=color, ansi_bg=color)
         echo_yx(c, value)
         screen[y, starting_x] = value
         starting_x += block_seperation_width
 
 
-def is_within_boundary(boundary_right_most_x, boundary_top_most_y,
-                       boundary_left_most_x, boundary_bottom_most_y,
-                       cursor):
-    """
-    Checks if cursor is within given boundary
-
-    :param boundary_right_most_x:
-    :param boundary_top_most_y:
-    :param boundary_left_most_x:
-    :param boundary_bottom_most_y:
-    :param cursor:
-    :return: boolean
-    """
-
-    if cursor.y < boundary_top_most_y:
-        return False
-    elif cursor.y > boundary_bottom_most_y:
-        return False
-    elif cursor.x < boundary_left_most_x:
-        return False
-    elif cursor.x > boundary_right_most_x:
-        return False
-
-    return True
-
-
 def print_graph(term, screen, screen_dates, x, y, graph_left_most_x, matrix, githeat):
     """
-    Prints graph
+    Prints graph. `screen` holds what was last drawn in each cell, so only cells
+    whose value changed are written, each run of adjacent changed cells in a row
+    with a single cursor move, and the whole update with a single write
 
     :param term:
     :param screen:
@@ -276,29 +284,42 @@ def print_graph(term, screen, screen_dates, x, y, graph_left_most_x, matrix, git
     :param matrix:
     :param githeat:
     """
+    output = []
     #  for each day of the week
     for i in range(7):
+        run_x, run = x, []  # changed cells left of x not written yet
         #  for the week column in the matrix
-        for week in matrix:
+        for week in range(len(matrix)):
+            level = matrix.level(week, i)
 
             if githeat.month_merge:
-                #  check if value in that week is just empty spaces and not colorize
-                if week.col[i][1] == githeat.width:
+                #  skip empty cells
+                if level == matrix.EMPTY:
                     continue
 
-            c = Cursor(y, x, term)
-            value = week.col[i][1]
-            screen[(c.y, c.x)] = value
-            screen_dates[(c.y, c.x)] = week.col[i][0]
-
-            echo_yx(c, value)
+            value = githeat.paint(level)
+            screen_dates[(y, x)] = matrix.day(week, i)
+            if screen.get((y, x)) != value:
+                screen[(y, x)] = value
+                if not run:
+                    run_x = x
+                run.append(value)
+            elif run:
+                output.append(term.move(y, run_x) + u''.join(run))
+                run = []
 
             x += len(githeat.width)
 
+        if run:
+            output.append(term.move(y, run_x) + u''.join(run))
+
         # reset x
         x = graph_left_most_x
         y += 1
 
+    if output:
+        echo(u''.join(output))
+
 
 def print_header_left(term, text, screen={}):
     """
@@ -343,20 +364,43 @@ def print_header_right(term, text, screen={}):
     screen[location.y, location.x] = value
 
 
-def print_footer_left(term, text, screen={}):
+def print_footer_left(term, text, screen=None, progress=None):
     """
-    Prints text at bottom left of terminal
+    Prints text at bottom left of terminal, and a progress indicator at its right
+    end while commits are loading
 
     :param term:
     :param text:
-    :param screen:
+    :param screen: ScreenBuffer
+    :param progress: progress text, or None once loaded
     :return:
     """
+    if screen is None:
+        screen = ScreenBuffer()
     location = Cursor(term.height - 1, 0, term)
     value = text
     echo_yx(location, value)
     screen[location.y, location.x] = value
 
+    progress_x = term.width - len(progress or '')
+    for x, _ in screen.row(location.y):
+        if x > 0 and (x != progress_x or progress is None):
+            del screen[location.y, x]  # stale progress indicator
+    if progress is not None:
+        location = Cursor(location.y, progress_x, term)
+        value = term.reverse(progress)
+        echo_yx(location, value)
+        screen[location.y, location.x] = value
+
+
+def loading_progress(loader):
+    """
+    Returns the footer progress text of a Loader, or None once it's done
+    """
+    if loader.done:
+        return None
+    return u" Loading commits... {:,} ".format(loader.read)
+
 
 def resize_until_fit(texts_list, width):
     """
@@ -384,18 +428,131 @@ def resize_until_fit(texts_list, width):
     return texts_list
 
 
-def open_commits_terminal(new_cursor_date_value, commits_on_date, githeat):
+def format_commit(term, commit, colors):
+    """
+    Returns the line showing a commit in the commits terminal
+
+    :param term:
+    :param commit: Commit
+    :param colors: colors of the graph, the hash, author and email are drawn in
+    """
+    commit_hash, cdate, spaces, subject, author, email, = resize_until_fit(
+            [
+                commit.abbr_commit_hash,
+                str(commit.date.strftime("%H:%M:%S %z")),
+                "  ",
+                commit.subject,
+                commit.author,
+                commit.author_email,
+            ],
+            term.width - 7  # for spaces and '<', '>' between emails
+    )
+
+    value = [
+        colorize(commit_hash, ansi=colors[1]),
+        cdate,
+        spaces,
+        term.bold(subject),
+        colorize(author, ansi=colors[2]),
+    ]
+
+    if email:
+        value.append(colorize("<{}>".format(email), ansi=colors[3]))
+
+    return " ".join(value)
+
+
+class CommitRows:
+    """
+    Lines of the commits at some rows of a store, only built and formatted when
+    shown and kept in a least recently used cache, so days with thousands of
+    commits open and scroll at the cost of the rows on screen
+    """
+
+    def __init__(self, commits_db, rows, format_row, cache_size=COMMIT_ROWS_CACHE):
+        """
+        :param commits_db: CommitStore or LazyCommitStore
+        :param rows: rows of the commits in commits_db, see `CommitStore.rows`
+        :param format_row: callable returning the line of a commit
+        :param cache_size: number of formatted lines kept
+        """
+        self.commits_db = commits_db
+        self.rows = rows
+        self.format_row = format_row
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()  # index -> line, oldest first
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, idx):
+        line = self._cache.pop(idx, None)
+        if line is None:
+            line = self.format_row(self.commits_db.commit(self.rows[idx]))
+            if len(self._cache) >= self.cache_size:
+                self._cache.popitem(last=False)
+        self._cache[idx] = line
+        return line
+
+
+def print_commit_rows(term, rows, top, first_y):
+    """
+    Returns the escape sequences that draw rows from index top in the window from
+    first_y to the bottom of the terminal
+
+    :param term:
+    :param rows: CommitRows
+    :param top: index of the row at the top of the window
+    :param first_y: first line of the window
+    """
+    output = []
+    for y in range(first_y, term.height):
+        idx = top + y - first_y
+        output.append(term.move(y, 0) + (rows[idx] if idx < len(rows) else u'') +
+                      term.clear_eol)
+    return u''.join(output)
+
+
+def scroll_commit_rows(term, rows, top, new_top, first_y):
+    """
+    Returns the escape sequences that scroll the window from first_y to the
+    bottom of the terminal by one row, drawing only the row scrolled in. Further
+    moves, or terminals without scroll regions, redraw the window
+
+    :param term:
+    :param rows: CommitRows
+    :param top: index of the row at the top of the window
+    :param new_top: index of the row to show at the top
+    :param first_y: first line of the window
+    """
+    bottom = term.height - 1
+    if abs(new_top - top) != 1 or not (term.csr and term.ind and term.ri):
+        return print_commit_rows(term, rows, new_top, first_y)
+
+    output = [term.csr(first_y, bottom)]
+    if new_top > top:  # scroll up, and draw the new bottom row
+        output.append(term.move(bottom, 0) + term.ind + term.move(bottom, 0))
+        idx = new_top + bottom - first_y
+    else:  # scroll down, and draw the new top row
+        output.append(term.move(first_y, 0) + term.ri + term.move(first_y, 0))
+        idx = new_top
+    output.append((rows[idx] if idx < len(rows) else u'') + term.clear_eol)
+    output.append(term.csr(0, bottom))
+    return u''.join(output)
+
+
+def open_commits_terminal(new_cursor_date_value, rows_on_date, githeat):
     """
     Creates a new terminal window for showing commits info
     :param new_cursor_date_value:
-    :param commits_on_date:
+    :param rows_on_date: rows of the day's commits in githeat.commits_db
     :param githeat: Githeat instance
     :return:
     """
-    screen = {}
+    screen = ScreenBuffer()
     term = Terminal()
     with term.keypad():
-        redraw(term=term, screen={})
+        redraw(term=term, screen=screen)
 
         # Print header
         print_header_left(term, str(new_cursor_date_value), screen)
@@ -403,43 +560,17 @@ def open_commits_terminal(new_cursor_date_value, commits_on_date, githeat):
         print_header_center(term, text, screen)
         text = u'ESC, to return'
         print_header_right(term, text, screen)
-        #  hold the commit info that we will display depending on scrolling window edges
-        commit_values_holder = []
-        for commit in commits_on_date:
-            commit_hash, cdate, spaces, subject, author, email, = resize_until_fit(
-                    [
-                        commit.abbr_commit_hash,
-                        str(commit.date.strftime("%H:%M:%S %z")),
-                        "  ",
-                        commit.subject,
-                        commit.author,
-                        commit.author_email,
-                    ],
-                    term.width - 7  # for spaces and '<', '>' between emails
-            )
-
-            value = [
-                colorize(commit_hash, ansi=githeat.colors[1]),
-                cdate,
-                spaces,
-                term.bold(subject),
-                colorize(author, ansi=githeat.colors[2]),
-            ]
-
-            if email:
-                value.append(colorize("<{}>".format(email), ansi=githeat.colors[3]))
-
-            value = " ".join(value)
-            commit_values_holder.append(value)
-
-        starting_y = 2
-        x = 0
-        range_from = 0
-        range_to = term.height - starting_y
-        for value in commit_values_holder[range_from:range_to]:
-            location = Cursor(starting_y, x, term)
-            echo_yx(location, value)
-            starting_y += 1
+
+        colors = githeat.colors
+        rows = CommitRows(githeat.commits_db, rows_on_date,
+                          lambda commit: format_commit(term, commit, colors))
+
+        #  scrolling window on commits, below the header text
+        first_y = 2
+        height = max(term.height - first_y, 1)
+        last_top = max(len(rows) - height, 0)
+        top = 0
+        echo(print_commit_rows(term, rows, top, first_y))
 
         while True:
             inp = term.inkey()
@@ -449,29 +580,22 @@ def open_commits_terminal(new_cursor_date_value, commits_on_date, githeat):
             elif inp == chr(3):  # ^c to exit
                 sys.exit(0)
 
-            # scrolling window on commits
-            starting_y = 2  # to not override header text
-            if inp.code == term.KEY_UP:
-                if range_from == 0:
-                    continue
-                range_from -= 1
-            elif inp.code == term.KEY_DOWN:
-                #  skip scrolling if commits fit terminal height
-                if len(commit_values_holder[range_from:]) < term.height:
-                    continue
-                range_from += 1
-
-            redraw(term=term, screen=screen)
-            #  echo the commits based on scrolling window
-            for value in commit_values_holder[range_from:]:
-                if starting_y > term.height:
-                    break
-                location = Cursor(starting_y, x, term)
-                echo_yx(location, value)
-                starting_y += 1
-
-
-def update_most_committers_footer(location, githeat, date, term, screen):
+            new_top = {
+                term.KEY_UP: top - 1,
+                term.KEY_DOWN: top + 1,
+                term.KEY_PGUP: top - height,
+                term.KEY_PGDOWN: top + height,
+                term.KEY_HOME: 0,
+                term.KEY_END: last_top,
+            }.get(inp.code, top)
+            new_top = min(max(new_top, 0), last_top)
+            if new_top != top:
+                echo(scroll_commit_rows(term, rows, top, new_top, first_y))
+                top = new_top
+
+
+def update_most_committers_footer(location, githeat, date, term, screen,
+                                  progress=None):
     """
     Updates footer with most commiters info
 
@@ -480,25 +604,25 @@ def update_most_committers_footer(location, githeat, date, term, screen):
     :param date:
     :param term:
     :param screen:
+    :param progress: see `print_footer_left`
     :return:
     """
 
     #  uncomment condition below to hide top authors if not in user specified days
-    if not githeat.commits_db.get(date):  # or date.strftime("%A") not in githeat.days:
+    if not githeat.commits_db.count(date):  # or date.strftime("%A") not in githeat.days:
         msg = "No commits"
+    elif not githeat.commits_db.is_loaded(date):
+        #  lazy loading, the day's commits are read when ENTER is pressed
+        msg = "{} {}".format(term.bold_white("Commits:"), githeat.commits_db.count(date))
     else:
-        top_n = githeat.get_top_n_commiters(
-                githeat.commits_db.get(date),
-                normailze_values=True,
-                n=5
-        )
+        top_n = githeat.get_top_committers(date, n=5)
 
         names = top_authors_to_string(top_n, colors=githeat.colors)
         msg = "{} {}".format(term.bold_white("Most committers:"), names)
 
     footer = " ".join([term.bold_white(unicode(date)), msg])
     value = term.ljust(footer)
-    print_footer_left(term, value, screen)
+    print_footer_left(term, value, screen, progress)
 
 
 def main(argv=None):
@@ -519,7 +643,9 @@ def main(argv=None):
         print("Are you sure you're in an initialized git directory?")
         return 0
     githeat = Githeat(g, **vars(args))
-    githeat.parse_commits()
+    #  draw the heatmap straight away, and repaint it as commits are read
+    loader = Loader(githeat)
+    loader.start()
     githeat.init_daily_contribution_map()
     githeat.compute_daily_contribution_map()
     githeat.normalize_daily_contribution_map()
@@ -535,7 +661,7 @@ def main(argv=None):
     new_width = (term.width - matrix_width) // 2
     csr = Cursor(term.height // 2 - 3, new_width, term)
 
-    screen = {}
+    screen = ScreenBuffer()
     screen_dates = {}
     with term.hidden_cursor(), \
          term.raw(), \
@@ -552,32 +678,19 @@ def main(argv=None):
 
         # Print footer
         text = u'Please move cursor to navigate through map'
-        print_footer_left(term, term.bold(text), screen)
+        print_footer_left(term, term.bold(text), screen, loading_progress(loader))
 
-        graph_right_most_x = term.width  # initialized at terminal width
         graph_left_most_x = csr.x
-        graph_top_most_y = csr.y
-        graph_x, graph_y = csr.x, csr.y
-
-        #  get graph boundaries
-        for i in range(7):
-            #  for the week column in the matrix
-            for week in matrix:
-                if githeat.month_merge:
-                    #  check if value in that week is just empty spaces and not colorize
-                    if week.col[i][1] == githeat.width:
-                        continue
-                graph_x += len(githeat.width)
-
-            graph_right_most_x = graph_x
-            graph_x = graph_left_most_x  # reset x
-            graph_y += 1
-        graph_bottom_most_y = graph_y - 1
+        graph_bottom_most_y = csr.y + 6  # a row per day of the week
 
         #  print graph
         graph_x, graph_y = csr.x, csr.y
         print_graph(term, screen, screen_dates, graph_x, graph_y,
                     graph_left_most_x, matrix, githeat)
+        #  the cells holding a day only depend on the dates shown, not on commits
+        grid = nav.DayGrid(screen_dates)
+        if grid.day((csr.y, csr.x)) is None and grid.days:
+            csr = Cursor(*min(grid.days), term=term)
 
         # print legend
         block_separation_width = 4
@@ -591,125 +704,115 @@ def main(argv=None):
                                screen,
                                term)
 
-        while True:
-            cursor_color = colorize(githeat.width, ansi=15, ansi_bg=15)
+        cursor_color = get_palette([15], githeat.width).legend[0]
+        keys = InputScheduler(term, nav.lookup_move)
+        running = True
+        while running:
             echo_yx(csr, cursor_color)
-            inp = term.inkey()
-
-            if inp in QUIT_KEYS:
-                # Esc or ^c pressed
-                break
-            elif inp == chr(99):
-                # c pressed, thus change color
-                githeat.switch_to_next_color()
-                #  changing colors requires regenerating matrix,
-                #  because values there are colorized strings, harder to change
-                matrix = githeat.compute_graph_matrix()
-                #  print changed color graph
-                print_graph(term, screen, screen_dates, graph_x, graph_y,
-                            graph_left_most_x, matrix, githeat)
+            events = keys.read(timeout=None if loader.done else LOADING_REFRESH)
+
+            #  the graph is recomputed and repainted once per frame
+            loaded = loader.poll()  # more commits were read
+            recompute = loaded
+            repaint = False
+
+            for inp in events:
+                if isinstance(inp, Move):
+                    #  arrow keys pressed during the frame, drawn once
+                    target = grid.replay((csr.y, csr.x), inp.steps)
+                elif inp in QUIT_KEYS:
+                    # Esc or ^c pressed
+                    running = False
+                    break
+                elif inp == chr(99):
+                    # c pressed, thus change color
+                    githeat.switch_to_next_color()
+                    #  matrix holds intensity levels, so it's only repainted
+                    repaint = True
+
+                    #  print changed color legend
+                    if not githeat.hide_legend:
+                        print_graph_legend(legend_x, legend_y,
+                                           githeat.width,
+                                           block_separation_width,
+                                           githeat.colors,
+                                           screen,
+                                           term)
+
+                    #  print changed color footer
+                    new_cursor_date_value = grid.day((csr.y, csr.x))
+                    if new_cursor_date_value:  # only if it needs changing
+                        location = Cursor(term.height - 1, 0, term)
+                        update_most_committers_footer(location, githeat,
+                                                      new_cursor_date_value, term,
+                                                      screen, loading_progress(loader))
+                    continue
+                elif inp.lower() in ONE_TO_SEVEN_KEYS or inp in Q_TO_QUOTES_KEYS:
+                    if inp.lower() in ONE_TO_SEVEN_KEYS:
+                        #  key from 1 to 7 pressed.
+                        githeat.toggle_day(int(inp) - 1)
+                    else:
+                        # key from q to ' pressed
+                        githeat.toggle_month(Q_TO_QUOTES_KEYS.index(inp.lower()))
 
-                #  print changed color legend
-                if not githeat.hide_legend:
-                    print_graph_legend(legend_x, legend_y,
-                                       githeat.width,
-                                       block_separation_width,
-                                       githeat.colors,
-                                       screen,
-                                       term)
-
-                #  print changed color footer
-                new_cursor_date_value = screen_dates.get((csr.y, csr.x))
-                if new_cursor_date_value:  # only if it needs changing
-                    location = nav.home(nav.bottom(csr))
-                    update_most_committers_footer(location, githeat,
-                                                  new_cursor_date_value, term, screen)
-                continue
-            elif inp.lower() in ONE_TO_SEVEN_KEYS or inp in Q_TO_QUOTES_KEYS:
-                if inp.lower() in ONE_TO_SEVEN_KEYS:
-                    #  key from 1 to 7 pressed.
-                    githeat.toggle_day(int(inp) - 1)
+                    # re-computing new daily contributions with the specified
+                    # days/months, at the end of the frame
+                    recompute = True
+                    continue
+                elif inp.code in (term.KEY_CENTER, term.KEY_KP_5):
+                    target = grid.center(csr.y)
                 else:
-                    # key from q to ' pressed
-                    githeat.toggle_month(Q_TO_QUOTES_KEYS.index(inp.lower()))
+                    target = (csr.y, csr.x)
+
+                new_cursor_date_value = grid.day(target)
+                if new_cursor_date_value is None:
+                    continue  # no day in that direction
+
+                n_csr = Cursor(target[0], target[1], term)
+                if n_csr != csr:
+                    # erase old cursor,
+                    prev_value = screen.get((csr.y, csr.x), u'  ')
+                    echo_yx(csr, prev_value)
+                    csr = n_csr
+                    location = Cursor(term.height - 1, 0, term)
+                    update_most_committers_footer(location, githeat,
+                                                  new_cursor_date_value, term, screen,
+                                                  loading_progress(loader))
+
+                if inp == chr(13):
+                    # ENTER pressed on date block
+                    rows_on_date = githeat.commits_db.rows(new_cursor_date_value)
+
+                    if rows_on_date:  # if block has contributions
+                        #  open commits desc terminal
+                        open_commits_terminal(new_cursor_date_value,
+                                              rows_on_date,
+                                              githeat)
+                        # redraw base terminal after exiting commits desc terminal
+                        redraw(term=term, screen=screen)
+                    else:
+                        info = u'Please choose a date with contributions \a'
+                        text = unicode(new_cursor_date_value) + ' ' + info
+                        print_footer_left(term, text, screen, loading_progress(loader))
+
+            if not running:
+                break
 
-                # re-computing new daily contributions with the specified days/months
+            if recompute:
                 githeat.recompute_daily_contribution_map()
                 matrix = githeat.compute_graph_matrix()
-                #  print new filtered graph
+            if recompute or repaint:
+                #  print new filtered or colored graph
                 print_graph(term, screen, screen_dates, graph_x, graph_y,
                             graph_left_most_x, matrix, githeat)
 
-                continue
-
-            else:
-                n_csr = nav.lookup_move(inp.code, csr, term, githeat)
-
-            # only allow moves within the graph boundaries
-            if not is_within_boundary(graph_right_most_x, graph_top_most_y,
-                                  graph_left_most_x, graph_bottom_most_y,
-                                  n_csr):
-                continue
-
-            # get value at new cursor block, if it exists
-            new_cursor_date_value = screen_dates.get((n_csr.y, n_csr.x))
-            if new_cursor_date_value:  # Cursor is on a date block with commits
-                location = nav.home(nav.bottom(csr))
-                update_most_committers_footer(location, githeat,
-                                              new_cursor_date_value, term, screen)
-            else:
-
-                horizontal_empty = False
-
-                #  jump through empty values
-                while not new_cursor_date_value and is_within_boundary(
-                                graph_right_most_x - 1,
-                        graph_top_most_y,
-                                graph_left_most_x + 1,
-                        graph_bottom_most_y,
-                        n_csr):
-
-                    x = n_csr.x
-                    y = n_csr.y
-                    if n_csr.x > csr.x:  # right move
-                        x += 1
-                    elif n_csr.x < csr.x:  # left move
-                        x -= 1
-                    else:
-                        horizontal_empty = True
-                        break  # skip jumping on up or down moves
-
-                    n_csr = Cursor(y, x, term)
-                    new_cursor_date_value = screen_dates.get((n_csr.y, n_csr.x))
-                    if new_cursor_date_value:
-                        location = nav.home(nav.bottom(csr))
-                        update_most_committers_footer(location, githeat,
-                                                      new_cursor_date_value, term, screen)
-
-                if horizontal_empty or not new_cursor_date_value:
-                    continue
-
-            if n_csr != csr:
-                # erase old cursor,
-                prev_value = screen.get((csr.y, csr.x), u'  ')
-                echo_yx(csr, prev_value)
-                csr = n_csr
-
-            if inp == chr(13):
-                # ENTER pressed on date block
-                commits_on_date = githeat.commits_db.get(new_cursor_date_value)
-
-                if commits_on_date:  # if block has contributions
-                    #  open commits desc terminal
-                    open_commits_terminal(new_cursor_date_value,
-                                          commits_on_date,
-                                          githeat)
-                    # redraw base terminal after exiting commits desc terminal
-                    redraw(term=term, screen=screen)
-                else:
-                    info = u'Please choose a date with contributions \a'
-                    text = unicode(new_cursor_date_value) + ' ' + info
-                    print_footer_left(term, text, screen)
+            if loaded:
+                footer = screen.get((term.height - 1, 0), u'')
+                if loader.done:
+                    footer = term.ljust(footer)  # erase the progress indicator
+                    if not githeat.commits_db:
+                        footer = term.ljust(term.bold(u'No contribution found'))
+                print_footer_left(term, footer, screen, loading_progress(loader))
 
     logger.debug("successful completion")
     return 0
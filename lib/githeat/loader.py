@@ -0,0 +1,101 @@
+""" Background commit loading for the interactive heatmap.
+
+Reading the git log of a large repository takes seconds. `Loader` reads it on a
+thread while the heatmap is already on screen. The thread only hands results to
+the main thread through a queue: the days of each batch of commits as they are
+read, then the complete store. The main thread adds them to the `Githeat`
+instance when it polls, so nothing it draws from is changed behind its back.
+
+"""
+from __future__ import absolute_import
+
+import threading
+
+try:
+    from queue import Empty
+    from queue import Queue
+except ImportError:  # python 2
+    from Queue import Empty
+    from Queue import Queue
+
+__all__ = "Loader",
+
+_DAYS = 'days'
+_DONE = 'done'
+_FAILED = 'failed'
+
+
+class Loader:
+    """
+    Reads the commits of a Githeat instance on a background thread
+    """
+
+    def __init__(self, githeat):
+        """
+        :param githeat: Githeat instance, its commits_db is replaced by a preview
+                        store that grows as commits are read
+        """
+        self.githeat = githeat
+        self.read = 0  # commits read so far
+        self.done = False
+        self._queue = Queue()
+        self._day_filter = githeat.day_filter()  # taken before days are toggled
+        self._thread = threading.Thread(target=self._run, name="githeat-loader")
+        self._thread.daemon = True  # don't keep a quitting UI waiting on git
+
+    def start(self):
+        """
+        Starts reading, with an empty preview store as the instance's commits_db
+        """
+        self.githeat.commits_db = self.githeat.preview_commits()
+        self.githeat.daily_totals = None
+        self._thread.start()
+
+    def _run(self):
+        try:
+            commits = self.githeat.read_commits(
+                progress=lambda days: self._queue.put((_DAYS, days)))
+            if self._day_filter:
+                commits = commits.select(self._day_filter)
+        except Exception as e:  # re-raised by poll on the main thread
+            self._queue.put((_FAILED, e))
+        else:
+            self._queue.put((_DONE, commits))
+
+    def poll(self):
+        """
+        Adds whatever was read since the last poll to the instance's commits_db,
+        without waiting
+
+        :return: True if commits_db changed
+        """
+        changed = False
+        while not self.done:
+            try:
+                kind, value = self._queue.get_nowait()
+            except Empty:
+                break
+            if kind == _DAYS:
+                self.read += len(value)
+                days = value
+                if self._day_filter:
+                    days = [day for day in days if self._day_filter(day)]
+                self.githeat.commits_db.days.extend(days)
+            elif kind == _DONE:
+                self.githeat.commits_db = value
+                self.done = True
+            else:
+                self.done = True
+                raise value
+            changed = True
+
+        if changed:
+            self.githeat.daily_totals = None
+        return changed
+
+    def wait(self, timeout=None):
+        """
+        Waits for the thread to finish reading, then polls
+        """
+        self._thread.join(timeout)
+        return self.poll()
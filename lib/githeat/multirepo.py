@@ -0,0 +1,126 @@
+""" Aggregate heatmaps over many repositories.
+
+Repositories are listed in a file, one path per line, or matched by a directory
+glob. The commits of each repository are read in a separate process, so the
+whole run takes about as long as the slowest repository, and are then merged
+into a single `CommitStore`. Without `concurrent.futures` (Python 2 without the
+futures backport) the repositories are read one after the other.
+
+"""
+from __future__ import absolute_import
+
+from functools import partial
+import glob
+import os
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # Python 2 without futures
+    ProcessPoolExecutor = None
+
+from git import Git
+from git.exc import GitCommandError
+from git.exc import GitCommandNotFound
+
+from .core import logger
+from .store import CommitStore
+
+__all__ = "repo_paths", "is_repository", "repo_commits", "collect", "merge"
+
+
+def repo_paths(repos_from=None, pattern=None):
+    """
+    Returns the paths of the repositories to aggregate, without duplicates
+
+    :param repos_from: file listing repository paths, one per line. Blank lines
+                       and lines starting with '#' are skipped
+    :param pattern: glob matching repository directories, e.g. '~/src/*'
+    :return: list of paths
+    """
+    paths = []
+    if repos_from:
+        with open(os.path.expanduser(repos_from)) as repos_file:
+            for line in repos_file:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    paths.append(os.path.expanduser(line))
+    if pattern:
+        paths.extend(sorted(p for p in glob.glob(os.path.expanduser(pattern))
+                            if os.path.isdir(p)))
+
+    seen = set()
+    unique = []
+    for path in paths:
+        key = os.path.realpath(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def is_repository(path):
+    """
+    Checks if path is the top level of a work tree or a bare repository. git
+    would otherwise read the repository enclosing path, if any
+    """
+    return os.path.exists(os.path.join(path, '.git')) or \
+        (os.path.isfile(os.path.join(path, 'HEAD')) and
+         os.path.isdir(os.path.join(path, 'objects')))
+
+
+def repo_commits(path, author=None, grep=None, cache=False, backend='git',
+                 logging_level="CRITICAL"):
+    """
+    Returns the commits of the repository at path, or None if it can't be read.
+    Used by `collect` in worker processes
+
+    """
+    #  imported here, githeat imports this module
+    from .githeat import Githeat
+
+    if not is_repository(path):
+        return None
+    try:
+        githeat = Githeat(Git(path), author=author, grep=grep, cache=cache,
+                          backend=backend, logging_level=logging_level)
+        return githeat.collect_commits()
+    except (GitCommandError, GitCommandNotFound, OSError):
+        return None
+
+
+def collect(paths, read_repo, max_workers=None, **kwargs):
+    """
+    Reads the commits of every repository and merges them into one store
+
+    :param paths: repository paths
+    :param read_repo: picklable callable taking a path and kwargs, returning the
+                      repository's CommitStore or None if it can't be read
+    :param max_workers: number of processes, defaults to the number of CPUs
+    :return: CommitStore
+    """
+    read = partial(read_repo, **kwargs)
+    if ProcessPoolExecutor is None or len(paths) < 2:
+        stores = [read(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers or None) as executor:
+            stores = list(executor.map(read, paths))
+
+    return merge(paths, stores)
+
+
+def merge(paths, stores):
+    """
+    Merges the stores read from each repository into one
+
+    :param paths: repository paths
+    :param stores: CommitStore of each path, None for repositories that couldn't
+                   be read
+    :return: CommitStore
+    """
+    commits = CommitStore()
+    for path, store in zip(paths, stores):
+        if store is None:
+            logger.warning("skipped {}, not a readable git repository".format(path))
+            continue
+        commits.update(store)
+    return commits
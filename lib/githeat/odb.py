@@ -0,0 +1,736 @@
+""" Direct reader for the git object database.
+
+Commits are read straight from the repository instead of through a `git log`
+subprocess: loose objects are inflated from ``objects/xx/...`` and packed ones
+are found through the version 2 ``.idx`` of each packfile, with offset and
+reference deltas applied in memory. History is walked from HEAD newest first,
+like `git log`, and stops following parents at commits older than the cutoff.
+When the repository has a commit-graph file, parents and commit times come
+from it and only the commits that are shown get inflated.
+
+A whole-window walk is slower than `git log`, so only revision ranges (the
+new commits of a cache update) are read this way. The reader needs Python 3;
+it and layouts it doesn't handle (SHA-256 repositories, partial clones,
+reftable, grafts, replace refs, old pack indexes, unknown object types) raise
+`UnsupportedRepository` so the caller can fall back to `git log`.
+
+"""
+from __future__ import absolute_import
+
+import binascii
+from collections import OrderedDict
+from collections import namedtuple
+import datetime
+import glob
+import heapq
+import itertools
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+
+from dateutil.tz import tzoffset
+
+from .util import helpers
+
+__all__ = "UnsupportedRepository", "ObjectDatabase", "CommitGraph", "find_git_dir"
+
+_OBJ_OFS_DELTA = 6
+_OBJ_REF_DELTA = 7
+_TYPES = {1: b'commit', 2: b'tree', 3: b'blob', 4: b'tag'}
+
+#  tzinfo by UTC offset in seconds, shared by all commits in that timezone
+_TIMEZONES = {}
+
+_IDX_MAGIC = b'\xfftOc'
+_GRAPH_SIGNATURE = b'CGPH'
+_GRAPH_PARENT_NONE = 0x70000000
+_HEX_SHA = re.compile(r'^[0-9a-f]{40}$')
+_ABBREV = re.compile(r'^\s*abbrev\s*=\s*(\d+)\s*$', re.MULTILINE | re.IGNORECASE)
+
+#  number of inflated packed objects kept around as delta bases
+_BASE_CACHE_SIZE = 256
+
+_CommitObject = namedtuple("_CommitObject",
+                           "parents author email time utc_offset subject")
+
+
+class UnsupportedRepository(Exception):
+    """
+    The repository can't be read without git
+    """
+
+
+def find_git_dir(path):
+    """
+    Finds the git directory of the repository containing path
+
+    :param path: a directory inside the work tree, or a bare repository
+    :return: tuple of (git_dir, common_dir). They differ for linked work trees,
+             whose objects and refs live in the main repository
+    """
+    if os.environ.get('GIT_DIR'):
+        raise UnsupportedRepository("GIT_DIR is set")
+
+    path = os.path.abspath(path)
+    while True:
+        dot_git = os.path.join(path, '.git')
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+            break
+        if os.path.isfile(dot_git):
+            with open(dot_git) as dot_git_file:
+                content = dot_git_file.read().strip()
+            if not content.startswith('gitdir:'):
+                raise UnsupportedRepository("can't read {}".format(dot_git))
+            git_dir = os.path.join(path, content[len('gitdir:'):].strip())
+            break
+        if os.path.isfile(os.path.join(path, 'HEAD')) and \
+                os.path.isdir(os.path.join(path, 'objects')):  # bare
+            git_dir = path
+            break
+        parent = os.path.dirname(path)
+        if parent == path:
+            raise UnsupportedRepository("no git directory found")
+        path = parent
+
+    common_dir = git_dir
+    try:
+        with open(os.path.join(git_dir, 'commondir')) as commondir_file:
+            common_dir = os.path.join(git_dir, commondir_file.read().strip())
+    except (IOError, OSError):
+        pass
+    return os.path.normpath(git_dir), os.path.normpath(common_dir)
+
+
+def _map(path):
+    with open(path, 'rb') as mapped_file:
+        return mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _inflate(data, pos, size):
+    """
+    Inflates the zlib stream starting at pos, which holds size bytes
+    """
+    inflater = zlib.decompressobj()
+    pieces = []
+    step = size + 64
+    while not inflater.eof:
+        chunk = data[pos:pos + step]
+        if not chunk:
+            raise zlib.error("truncated object")
+        pieces.append(inflater.decompress(chunk))
+        pos += step
+        step *= 2
+    inflated = b''.join(pieces)
+    if len(inflated) != size:
+        raise zlib.error("object size mismatch")
+    return inflated
+
+
+def _delta_size(delta, pos):
+    size = shift = 0
+    while True:
+        byte = delta[pos]
+        pos += 1
+        size |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            return size, pos
+
+
+def _apply_delta(base, delta):
+    """
+    Rebuilds an object from its base and a git delta
+    """
+    base_size, pos = _delta_size(delta, 0)
+    result_size, pos = _delta_size(delta, pos)
+    if base_size != len(base):
+        raise ValueError("delta base size mismatch")
+
+    result = bytearray()
+    end = len(delta)
+    while pos < end:
+        opcode = delta[pos]
+        pos += 1
+        if opcode & 0x80:  # copy from base
+            offset = size = 0
+            for i in range(4):
+                if opcode & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if opcode & (0x10 << i):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            result += base[offset:offset + (size or 0x10000)]
+        elif opcode:  # insert
+            result += delta[pos:pos + opcode]
+            pos += opcode
+        else:
+            raise ValueError("invalid delta opcode")
+
+    if len(result) != result_size:
+        raise ValueError("delta result size mismatch")
+    return bytes(result)
+
+
+def _find_name(table, names, fanout, sha):
+    """
+    Binary searches a sorted table of 20 byte object names
+
+    :param table: mapped file
+    :param names: offset of the first name in table
+    :param fanout: number of names starting with a byte less than or equal to
+                   each byte value
+    :param sha: 20 bytes binary object name
+    :return: position of sha in the table, or None
+    """
+    first = sha[0]
+    lo = fanout[first - 1] if first else 0
+    hi = fanout[first]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = names + 20 * mid
+        name = table[pos:pos + 20]
+        if name < sha:
+            lo = mid + 1
+        elif name > sha:
+            hi = mid
+        else:
+            return mid
+    return None
+
+
+class _Pack:
+    """
+    A packfile and its version 2 index, both memory mapped
+    """
+
+    def __init__(self, idx_path):
+        self.index = _map(idx_path)
+        if self.index[:4] != _IDX_MAGIC or \
+                struct.unpack_from('>I', self.index, 4)[0] != 2:
+            raise UnsupportedRepository("unsupported pack index {}".format(idx_path))
+        self.fanout = struct.unpack_from('>256I', self.index, 8)
+        self.count = self.fanout[255]
+        self._names = 8 + 256 * 4
+        self._offsets = self._names + 24 * self.count  # past names and CRCs
+        self._large_offsets = self._offsets + 4 * self.count
+        self.data = _map(idx_path[:-len('.idx')] + '.pack')
+
+    def offset(self, sha):
+        """
+        Returns the offset of the object in the packfile, or None
+        """
+        position = _find_name(self.index, self._names, self.fanout, sha)
+        if position is None:
+            return None
+        offset = struct.unpack_from('>I', self.index, self._offsets + 4 * position)[0]
+        if offset & 0x80000000:
+            offset = struct.unpack_from(
+                '>Q', self.index, self._large_offsets + 8 * (offset & 0x7fffffff))[0]
+        return offset
+
+    def entry(self, offset):
+        """
+        Reads the entry header at offset
+
+        :return: tuple of (type, size, data offset, delta base) where the delta
+                 base is a pack offset, a sha or None
+        """
+        data = self.data
+        byte = data[offset]
+        pos = offset + 1
+        obj_type = (byte >> 4) & 7
+        size = byte & 0x0f
+        shift = 4
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            size |= (byte & 0x7f) << shift
+            shift += 7
+
+        base = None
+        if obj_type == _OBJ_OFS_DELTA:
+            byte = data[pos]
+            pos += 1
+            distance = byte & 0x7f
+            while byte & 0x80:
+                byte = data[pos]
+                pos += 1
+                distance = ((distance + 1) << 7) | (byte & 0x7f)
+            base = offset - distance
+        elif obj_type == _OBJ_REF_DELTA:
+            base = data[pos:pos + 20]
+            pos += 20
+        return obj_type, size, pos, base
+
+
+class CommitGraph:
+    """
+    Git's commit-graph file, memory mapped: the parents and committer time of
+    every commit it lists, read without inflating the commit objects
+    """
+
+    def __init__(self, path):
+        self.data = data = _map(path)
+        signature, version, hash_version, chunk_count, base_graphs = \
+            struct.unpack_from('>4sBBBB', data, 0)
+        if signature != _GRAPH_SIGNATURE or version != 1 or hash_version != 1 or \
+                base_graphs:
+            raise UnsupportedRepository("unsupported commit-graph {}".format(path))
+
+        chunks = {}
+        for i in range(chunk_count):
+            chunk_id, offset = struct.unpack_from('>4sQ', data, 8 + 12 * i)
+            chunks[chunk_id] = offset
+        try:
+            self._fanout_offset = chunks[b'OIDF']
+            self._names = chunks[b'OIDL']
+            self._commit_data = chunks[b'CDAT']
+        except KeyError:
+            raise UnsupportedRepository("incomplete commit-graph {}".format(path))
+        self._edges = chunks.get(b'EDGE')
+        self.fanout = struct.unpack_from('>256I', data, self._fanout_offset)
+        self.count = self.fanout[255]
+
+    def name(self, position):
+        """
+        Returns the 20 bytes binary name of the commit at position
+        """
+        pos = self._names + 20 * position
+        return self.data[pos:pos + 20]
+
+    def position(self, sha):
+        """
+        Returns the position of a commit in the graph, or None if it isn't listed
+
+        :param sha: 20 bytes binary object name
+        """
+        return _find_name(self.data, self._names, self.fanout, sha)
+
+    def commit(self, position):
+        """
+        Returns the committer time and parents of the commit at position
+
+        :return: tuple of (time, list of parent positions)
+        """
+        parent1, parent2, time_high, time_low = struct.unpack_from(
+            '>IIII', self.data, self._commit_data + 36 * position + 20)
+
+        parents = []
+        if parent1 != _GRAPH_PARENT_NONE:
+            parents.append(parent1)
+        if parent2 & 0x80000000:  # octopus merge, the rest are in the edge list
+            edge = self._edges + 4 * (parent2 & 0x7fffffff)
+            while True:
+                parent = struct.unpack_from('>I', self.data, edge)[0]
+                parents.append(parent & 0x7fffffff)
+                if parent & 0x80000000:
+                    break
+                edge += 4
+        elif parent2 != _GRAPH_PARENT_NONE:
+            parents.append(parent2)
+        #  34 bit time, the lowest 2 bits of the first word are its top bits
+        return ((time_high & 0x3) << 32) | time_low, parents
+
+
+def _timezone(seconds):
+    tz = _TIMEZONES.get(seconds)
+    if tz is None:
+        tz = _TIMEZONES[seconds] = tzoffset(None, seconds)
+    return tz
+
+
+def _parse_ident(value, encoding):
+    """
+    Splits 'Name <email> timestamp +hhmm' into (name, email, timestamp, offset)
+    """
+    lt = value.find(b'<')
+    gt = value.rfind(b'>')
+    if lt < 0 or gt < lt:
+        raise ValueError("malformed identity")
+    timestamp, tz = (value[gt + 1:].split() + [b'0', b'+0000'])[:2]
+    offset = int(tz[1:3]) * 3600 + int(tz[3:5]) * 60
+    if tz[:1] == b'-':
+        offset = -offset
+    return (value[:lt].strip().decode(encoding, 'replace'),
+            value[lt + 1:gt].decode(encoding, 'replace'),
+            int(timestamp),
+            offset)
+
+
+def _subject(message, encoding):
+    """
+    Returns the subject of a commit message like git's %s: the first paragraph
+    with its lines joined by spaces
+    """
+    lines = []
+    for line in message.split(b'\n'):
+        line = line.rstrip()
+        if line:
+            lines.append(line)
+        elif lines:
+            break
+    return b' '.join(lines).decode(encoding, 'replace')
+
+
+def parse_commit(data):
+    """
+    Parses the raw content of a commit object
+
+    :param data: bytes
+    :return: _CommitObject, with the committer's time
+    """
+    headers, _, message = data.partition(b'\n\n')
+    parents = []
+    author = committer = None
+    encoding = 'utf-8'
+    for line in headers.split(b'\n'):
+        key, _, value = line.partition(b' ')
+        if key == b'parent':
+            parents.append(binascii.unhexlify(value))
+        elif key == b'author':
+            author = value
+        elif key == b'committer':
+            committer = value
+        elif key == b'encoding':
+            encoding = value.decode('ascii', 'replace')
+    try:
+        b''.decode(encoding)
+    except LookupError:
+        encoding = 'utf-8'
+
+    name, email, _, _ = _parse_ident(author or b'<>', encoding)
+    _, _, timestamp, offset = _parse_ident(committer or b'<>', encoding)
+    return _CommitObject(parents, name, email, timestamp, offset,
+                         _subject(message, encoding))
+
+
+class ObjectDatabase:
+    """
+    Read-only access to the objects and refs of a repository
+    """
+
+    def __init__(self, path, commit_graph=True):
+        if sys.version_info[0] < 3:  # pack data is indexed as bytes, not str
+            raise UnsupportedRepository("the object database reader needs Python 3")
+        self.git_dir, self.common_dir = find_git_dir(path)
+        self.config = self._read(os.path.join(self.common_dir, 'config')) or ''
+        self._check_layout()
+
+        objects = os.path.join(self.common_dir, 'objects')
+        self.object_dirs = [objects]
+        alternates = self._read(os.path.join(objects, 'info', 'alternates')) or ''
+        for line in alternates.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                self.object_dirs.append(os.path.join(objects, line))
+
+        self.packs = []
+        for object_dir in self.object_dirs:
+            for idx_path in sorted(glob.glob(os.path.join(object_dir, 'pack', '*.idx'))):
+                self.packs.append(_Pack(idx_path))
+
+        shallow = self._read(os.path.join(self.common_dir, 'shallow')) or ''
+        self.shallow = set(binascii.unhexlify(line) for line in shallow.split())
+
+        #  split commit-graph chains aren't read, their commits are inflated
+        self.graph = None
+        graph_path = os.path.join(objects, 'info', 'commit-graph')
+        if commit_graph and os.path.isfile(graph_path):
+            self.graph = CommitGraph(graph_path)
+
+        self._packed_refs = None
+        self._bases = OrderedDict()  # (pack, offset) -> (type, data)
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path) as text_file:
+                return text_file.read()
+        except (IOError, OSError):
+            return None
+
+    def _check_layout(self):
+        config = self.config.lower()
+        if 'objectformat' in config and 'sha256' in config:
+            raise UnsupportedRepository("SHA-256 repository")
+        if 'partialclone' in config:
+            raise UnsupportedRepository("partial clone")
+        if 'reftable' in config:
+            raise UnsupportedRepository("reftable refs")
+        if os.path.exists(os.path.join(self.common_dir, 'info', 'grafts')):
+            raise UnsupportedRepository("grafts")
+        replace = os.path.join(self.common_dir, 'refs', 'replace')
+        packed_refs = self._read(os.path.join(self.common_dir, 'packed-refs')) or ''
+        if (os.path.isdir(replace) and os.listdir(replace)) or \
+                ' refs/replace/' in packed_refs:
+            raise UnsupportedRepository("replace refs")
+
+    def object(self, sha):
+        """
+        Returns the type and content of an object
+
+        :param sha: 20 bytes binary object name
+        :return: tuple of (type, data), type being e.g. b'commit'
+        """
+        for pack in self.packs:
+            offset = pack.offset(sha)
+            if offset is not None:
+                return self._packed_object(pack, offset)
+
+        name = binascii.hexlify(sha).decode('ascii')
+        for object_dir in self.object_dirs:
+            try:
+                with open(os.path.join(object_dir, name[:2], name[2:]), 'rb') as loose:
+                    raw = zlib.decompress(loose.read())
+            except (IOError, OSError):
+                continue
+            header, _, data = raw.partition(b'\0')
+            return header.split(b' ')[0], data
+        raise UnsupportedRepository("missing object {}".format(name))
+
+    def _packed_object(self, pack, offset):
+        key = (pack, offset)
+        cached = self._bases.pop(key, None)
+        if cached is None:
+            obj_type, size, pos, base = pack.entry(offset)
+            data = _inflate(pack.data, pos, size)
+            if obj_type == _OBJ_OFS_DELTA:
+                obj_type, base_data = self._packed_object(pack, base)
+                data = _apply_delta(base_data, data)
+            elif obj_type == _OBJ_REF_DELTA:
+                obj_type, base_data = self.object(base)
+                data = _apply_delta(base_data, data)
+            elif obj_type in _TYPES:
+                obj_type = _TYPES[obj_type]
+            else:
+                raise UnsupportedRepository("unknown object type {}".format(obj_type))
+            cached = (obj_type, data)
+            if len(self._bases) >= _BASE_CACHE_SIZE:
+                self._bases.popitem(last=False)
+        self._bases[key] = cached  # most recently used last
+        return cached
+
+    def commit(self, sha):
+        """
+        Returns the parsed commit, peeling annotated tags
+
+        :param sha: 20 bytes binary object name
+        :return: _CommitObject
+        """
+        obj_type, data = self.object(sha)
+        while obj_type == b'tag':
+            sha = binascii.unhexlify(data[len(b'object '):data.index(b'\n')])
+            obj_type, data = self.object(sha)
+        if obj_type != b'commit':
+            raise UnsupportedRepository("not a commit")
+        return parse_commit(data)
+
+    def ref(self, name, depth=0):
+        """
+        Resolves a ref name such as 'HEAD' or 'refs/heads/master'
+
+        :return: 20 bytes binary object name
+        """
+        if depth > 5:
+            raise UnsupportedRepository("too many symbolic refs")
+        base = self.git_dir if '/' not in name else self.common_dir
+        value = self._read(os.path.join(base, name))
+        if value is None:
+            value = self._packed_refs_by_name().get(name)
+        if value is None:
+            raise UnsupportedRepository("unknown ref {}".format(name))
+        value = value.strip()
+        if value.startswith('ref:'):
+            return self.ref(value[len('ref:'):].strip(), depth + 1)
+        if not _HEX_SHA.match(value):
+            raise UnsupportedRepository("unreadable ref {}".format(name))
+        return binascii.unhexlify(value)
+
+    def _packed_refs_by_name(self):
+        if self._packed_refs is None:
+            self._packed_refs = {}
+            packed_refs = self._read(os.path.join(self.common_dir, 'packed-refs')) or ''
+            for line in packed_refs.splitlines():
+                if line and line[0] not in '#^':
+                    sha, _, name = line.partition(' ')
+                    self._packed_refs[name.strip()] = sha
+        return self._packed_refs
+
+    def resolve(self, revision):
+        """
+        Resolves a full hex object name, 'HEAD', or a branch or tag name to the
+        commit it points to
+        """
+        if _HEX_SHA.match(revision):
+            return self.peel(binascii.unhexlify(revision))
+        if revision == 'HEAD' or revision.startswith('refs/'):
+            return self.peel(self.ref(revision))
+        for prefix in ('refs/heads/', 'refs/tags/'):
+            try:
+                return self.peel(self.ref(prefix + revision))
+            except UnsupportedRepository:
+                pass
+        raise UnsupportedRepository("can't resolve {}".format(revision))
+
+    def peel(self, sha):
+        """
+        Returns the commit an annotated tag points to, or sha if it isn't a tag
+        """
+        if self.graph is not None and self.graph.position(sha) is not None:
+            return sha
+        obj_type, data = self.object(sha)
+        while obj_type == b'tag':
+            sha = binascii.unhexlify(data[len(b'object '):data.index(b'\n')])
+            obj_type, data = self.object(sha)
+        return sha
+
+    #  While walking history, commits listed in the commit-graph are identified
+    #  by their int position in it and the others by their binary name, so a
+    #  commit always has the same key whichever child it was reached from.
+
+    def _node(self, sha):
+        if self.graph is not None:
+            position = self.graph.position(sha)
+            if position is not None:
+                return position
+        return sha
+
+    def _sha(self, node):
+        return self.graph.name(node) if isinstance(node, int) else node
+
+    def _history(self, node):
+        """
+        Returns the committer time and parent nodes of a commit, and the parsed
+        commit if it had to be inflated
+        """
+        if isinstance(node, int):
+            time, parents = self.graph.commit(node)
+            return time, parents, None
+        commit = self.commit(node)
+        return commit.time, [self._node(parent) for parent in commit.parents], commit
+
+    def abbrev_length(self):
+        """
+        Returns the abbreviated hash length git would use, from core.abbrev or
+        the approximate number of objects. Unlike git it isn't extended when the
+        abbreviation is ambiguous
+        """
+        match = _ABBREV.search(self.config)
+        if match:
+            return max(4, min(40, int(match.group(1))))
+        count = sum(pack.count for pack in self.packs)
+        try:
+            #  git estimates loose objects from a single fan-out directory
+            count += len(os.listdir(os.path.join(self.object_dirs[0], '17'))) * 256
+        except OSError:
+            pass
+        return max(7, (count.bit_length() + 1) // 2)
+
+    def _walk(self, include, exclude, since):
+        """
+        Yields the commits reachable from include but not from exclude, newest
+        first like git's revision walk. Parents of commits older than since
+        aren't followed.
+
+        Without exclude, commits are yielded as they are reached. Otherwise, like
+        `git log a..b`, the walk stops once only excluded commits are left to
+        visit, and commits are yielded at the end because a commit may turn out to
+        be excluded after it was reached.
+
+        :return: generator of (node, commit) tuples, commit being None if it
+                 hasn't been inflated
+        """
+        hidden = set()
+        parents_of = {}  # visited node -> parent nodes, to pass exclusion on
+        queue = []
+        seen = set()
+        counter = itertools.count()
+        limited = bool(exclude)
+        shown = []
+
+        def hide(node):
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                if node not in hidden:
+                    hidden.add(node)
+                    stack.extend(parents_of.get(node, ()))
+
+        def push(node):
+            if node not in seen:
+                seen.add(node)
+                time, parents, commit = self._history(node)
+                heapq.heappush(queue, (-time, next(counter), node, parents, commit))
+
+        for node in exclude:
+            push(node)
+            hide(node)
+        for node in include:
+            push(node)
+
+        while queue:
+            if limited and all(entry[2] in hidden for entry in queue):
+                break
+            time, _, node, parents, commit = heapq.heappop(queue)
+            if since is not None and -time < since:
+                continue
+            if self.shallow and self._sha(node) in self.shallow:
+                parents = []
+            if limited:
+                parents_of[node] = parents
+            for parent in parents:
+                push(parent)
+                if node in hidden:
+                    hide(parent)
+            if node in hidden:
+                continue
+            if limited:
+                shown.append((node, commit))
+            else:
+                yield node, commit
+
+        for node, commit in shown:
+            if node not in hidden:
+                yield node, commit
+
+    def log(self, since=None, revision=None, author=None, grep=None):
+        """
+        Yields commits newest first, like `git log --since=... revision`
+
+        :param since: POSIX timestamp, parents of older commits aren't followed
+        :param revision: 'HEAD' by default, or a 'start..end' range
+        :param author: not supported, git's regex dialect would be needed
+        :param grep: not supported, see author
+        :return: generator of [abbr_commit_hash, date, author, author_email,
+                 subject] records, as `gitlog.parse_commit` returns
+        """
+        if author or grep:
+            raise UnsupportedRepository("author and grep filters need git log")
+
+        revision = revision or 'HEAD'
+        exclude = []
+        if '..' in revision:
+            if '...' in revision:
+                raise UnsupportedRepository("symmetric difference")
+            start, revision = revision.split('..', 1)
+            exclude.append(self._node(self.resolve(start or 'HEAD')))
+        include = [self._node(self.resolve(revision or 'HEAD'))]
+
+        abbrev = self.abbrev_length()
+        for node, commit in self._walk(include, exclude, since):
+            sha = self._sha(node)
+            if commit is None:  # only commits that are shown get inflated
+                commit = self.commit(sha)
+            date = datetime.datetime.fromtimestamp(commit.time,
+                                                   _timezone(commit.utc_offset))
+            yield [binascii.hexlify(sha)[:abbrev].decode('ascii'),
+                   date,
+                   helpers.remove_accents(commit.author),
+                   commit.email,
+                   helpers.remove_accents(commit.subject)]
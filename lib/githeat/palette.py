@@ -0,0 +1,50 @@
+""" Pre-rendered color blocks.
+
+A heatmap only ever draws one of a handful of colors at one block width, so
+the escape sequences for each (color, width) block are rendered once per
+palette and reused for every cell, instead of calling `colorize` per day.
+
+"""
+from __future__ import absolute_import
+
+from xtermcolor import colorize
+
+__all__ = "Palette", "get_palette"
+
+
+class Palette:
+    """
+    Rendered blocks for a list of colors at one block width
+    """
+
+    def __init__(self, colors, width):
+        self.colors = list(colors)
+        self.width = width
+        #  background colored blocks, as drawn in the graph
+        self.blocks = [colorize(width, ansi=0, ansi_bg=c) for c in self.colors]
+        #  blocks with the same foreground and background, as drawn in the legend
+        self.legend = [colorize(width, ansi=c, ansi_bg=c) for c in self.colors]
+
+    def __getitem__(self, level):
+        return self.blocks[level]
+
+    def __len__(self):
+        return len(self.blocks)
+
+
+_PALETTES = {}
+
+
+def get_palette(colors, width):
+    """
+    Returns the Palette for colors and width, rendering it the first time
+
+    :param colors: list of xterm color numbers
+    :param width: block string, e.g. '  '
+    :return: Palette
+    """
+    key = (tuple(colors), width)
+    palette = _PALETTES.get(key)
+    if palette is None:
+        palette = _PALETTES[key] = Palette(colors, width)
+    return palette
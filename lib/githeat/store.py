@@ -0,0 +1,433 @@
+""" Columnar storage for parsed commits.
+
+Instead of one Python object per commit, commits are kept in parallel arrays
+(day ordinal, local timestamp, UTC offset, author id, email id) plus two byte
+buffers holding every abbreviated hash and subject back to back. Authors and
+emails repeat across many commits, so each distinct one is stored once in a
+string table and referenced by id. `Commit` objects are only built when the
+commits of a day are asked for; they are slotted, and take their author and
+email from the string tables of the store they were built from, so commits by
+the same author share one string.
+
+`LazyCommitStore` only holds the day of each commit up front, which is all the
+heatmap needs, and reads the commits of a day from git when they are shown.
+
+"""
+from __future__ import absolute_import
+
+from array import array
+from collections import Counter
+import datetime
+
+from dateutil.tz import tzoffset
+
+__all__ = "Commit", "CommitStore", "LazyCommitStore", "StringTable"
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+#  offset stored for naive datetimes, which have no timezone to restore
+_NAIVE = -1 << 31
+
+
+class Commit(object):
+    __slots__ = 'abbr_commit_hash', 'date', 'author', 'author_email', 'subject'
+
+    def __init__(self, abbr_commit_hash, date, author, author_email, subject):
+        self.abbr_commit_hash = abbr_commit_hash
+        self.date = date
+        self.author = author
+        self.author_email = author_email
+        self.subject = subject
+
+    def __cmp__(self, other):
+        if hasattr(other, 'date'):
+            return self.date.__cmp__(other.date)
+
+    def __str__(self):
+        return "{} on {}".format(self.author, self.date)
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class StringTable:
+    """
+    Stores each distinct string once and maps it to a small integer id
+    """
+
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+
+    def add(self, string):
+        """
+        Returns the id of string, adding it to the table if needed
+        """
+        string_id = self.ids.get(string)
+        if string_id is None:
+            string_id = self.ids[string] = len(self.strings)
+            self.strings.append(string)
+        return string_id
+
+    def __getitem__(self, string_id):
+        return self.strings[string_id]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class CommitStore:
+    """
+    Commits stored by column, with read access by day like a dict of
+    `Commit` lists keyed by `datetime.date`
+    """
+
+    def __init__(self):
+        self.days = array('l')  # date.toordinal() of the committer's local date
+        self.timestamps = array('l')  # committer's local time, seconds since epoch
+        self.utc_offsets = array('l')  # seconds, or _NAIVE
+        self.author_ids = array('l')
+        self.email_ids = array('l')
+        self.hash_ends = array('l')  # end of each hash in self.hashes
+        self.subject_ends = array('l')  # end of each subject in self.subjects
+        self.hashes = bytearray()
+        self.subjects = bytearray()
+        self.authors = StringTable()
+        self.emails = StringTable()
+
+        self._rows_by_day = {}  # day ordinal -> array of row indices
+        self._timezones = {}
+
+    def append(self, abbr_commit_hash, date, author, author_email, subject):
+        """
+        Adds a commit
+
+        :param date: datetime, in the committer's timezone
+        """
+        local = date.replace(tzinfo=None) - _EPOCH
+        offset = date.utcoffset()
+        self._append(local.days + _EPOCH_ORDINAL,
+                     local.days * _SECONDS_PER_DAY + local.seconds,
+                     _NAIVE if offset is None else
+                     offset.days * _SECONDS_PER_DAY + offset.seconds,
+                     self.authors.add(author),
+                     self.emails.add(author_email),
+                     abbr_commit_hash.encode('utf-8'),
+                     subject.encode('utf-8'))
+
+    def extend(self, records):
+        """
+        Adds commits from an iterable of
+        [abbr_commit_hash, date, author, author_email, subject] records
+        """
+        for record in records:
+            self.append(*record)
+
+    def _append(self, day, timestamp, utc_offset, author_id, email_id,
+                abbr_commit_hash, subject):
+        row = len(self.days)
+        self.days.append(day)
+        self.timestamps.append(timestamp)
+        self.utc_offsets.append(utc_offset)
+        self.author_ids.append(author_id)
+        self.email_ids.append(email_id)
+        self.hashes += abbr_commit_hash
+        self.hash_ends.append(len(self.hashes))
+        self.subjects += subject
+        self.subject_ends.append(len(self.subjects))
+
+        rows = self._rows_by_day.get(day)
+        if rows is None:
+            rows = self._rows_by_day[day] = array('l')
+        rows.append(row)
+
+    def _raw_hash(self, row):
+        start = self.hash_ends[row - 1] if row else 0
+        return bytes(self.hashes[start:self.hash_ends[row]])
+
+    def _raw_subject(self, row):
+        start = self.subject_ends[row - 1] if row else 0
+        return bytes(self.subjects[start:self.subject_ends[row]])
+
+    def _append_row(self, other, row):
+        self._append(other.days[row],
+                     other.timestamps[row],
+                     other.utc_offsets[row],
+                     self.authors.add(other.authors[other.author_ids[row]]),
+                     self.emails.add(other.emails[other.email_ids[row]]),
+                     other._raw_hash(row),
+                     other._raw_subject(row))
+
+    def select(self, day_filter):
+        """
+        Returns a new store with the commits whose day passes day_filter
+
+        :param day_filter: callable taking a day ordinal
+        """
+        selected = CommitStore()
+        for row, day in enumerate(self.days):
+            if day_filter(day):
+                selected._append_row(self, row)
+        return selected
+
+    def update(self, other):
+        """
+        Appends all commits of another store
+        """
+        for row in range(len(other.days)):
+            self._append_row(other, row)
+
+    def commit(self, row):
+        """
+        Builds the `Commit` stored at row
+        """
+        return Commit(self._raw_hash(row).decode('utf-8'),
+                      self._date(row),
+                      self.authors[self.author_ids[row]],
+                      self.emails[self.email_ids[row]],
+                      self._raw_subject(row).decode('utf-8'))
+
+    def _date(self, row):
+        date = _EPOCH + datetime.timedelta(seconds=self.timestamps[row])
+        utc_offset = self.utc_offsets[row]
+        if utc_offset == _NAIVE:
+            return date
+        tz = self._timezones.get(utc_offset)
+        if tz is None:
+            tz = self._timezones[utc_offset] = tzoffset(None, utc_offset)
+        return date.replace(tzinfo=tz)
+
+    def top_authors(self, n=5, day=None):
+        """
+        Returns a list of (author, number of commits) of the top n committers,
+        of all commits or of the commits on day
+        """
+        if day is None:
+            counter = Counter(self.author_ids)
+        else:
+            rows = self._rows_by_day.get(day.toordinal(), ())
+            counter = Counter(self.author_ids[row] for row in rows)
+        return [(self.authors[author_id], count)
+                for author_id, count in counter.most_common(n)]
+
+    def count(self, day):
+        """
+        Returns the number of commits on day
+        """
+        rows = self._rows_by_day.get(day.toordinal())
+        return len(rows) if rows is not None else 0
+
+    def is_loaded(self, day):
+        """
+        Returns whether the commits of day have been read, always the case here
+        """
+        return True
+
+    def rows(self, day):
+        """
+        Returns the rows of the commits on day, to build each with `commit`
+        """
+        return self._rows_by_day.get(day.toordinal(), ())
+
+    def get(self, day, default=None):
+        """
+        Returns the list of commits on day, or default if there are none
+        """
+        rows = self._rows_by_day.get(day.toordinal())
+        if rows is None:
+            return default
+        return [self.commit(row) for row in rows]
+
+    def __getitem__(self, day):
+        return self.get(day, [])
+
+    def __contains__(self, day):
+        return day.toordinal() in self._rows_by_day
+
+    def __iter__(self):
+        for day in self._rows_by_day:
+            yield datetime.date.fromordinal(day)
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[day] for day in self]
+
+    def items(self):
+        return [(day, self[day]) for day in self]
+
+    def __len__(self):
+        """
+        Returns the number of days with commits
+        """
+        return len(self._rows_by_day)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        #  derived from self.days, rebuilt on load
+        del state['_rows_by_day']
+        del state['_timezones']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._timezones = {}
+        self._rows_by_day = {}
+        for row, day in enumerate(self.days):
+            rows = self._rows_by_day.get(day)
+            if rows is None:
+                rows = self._rows_by_day[day] = array('l')
+            rows.append(row)
+
+
+class LazyCommitStore:
+    """
+    Day ordinals of commits, read up front, with the commits themselves read
+    from git a day at a time when they are first asked for. Has the read access
+    of `CommitStore`
+    """
+
+    def __init__(self, read_log, day_filter=None):
+        """
+        :param read_log: callable taking since and until dates (None for the
+                         whole window) and returning commit records, see
+                         `CommitStore.extend`
+        :param day_filter: callable taking a day ordinal, commits on days it
+                           rejects are left out
+        """
+        self.days = array('l')  # date.toordinal() of the committer's local date
+        self._read_log = read_log
+        self._day_filter = day_filter
+        self._counts = None  # day ordinal -> number of commits
+        self._counted = 0  # len(self.days) when _counts was built
+        self._loaded = CommitStore()
+        self._loaded_days = set()
+        self._complete = False
+
+    def _day_counts(self):
+        if self._counts is None or self._counted != len(self.days):
+            self._counts = Counter(self.days)
+            self._counted = len(self.days)
+        return self._counts
+
+    def _keep(self, records, days=None):
+        for record in records:
+            day = record[1].toordinal()
+            if (days is None or day in days) and \
+                    (self._day_filter is None or self._day_filter(day)):
+                yield record
+
+    def is_loaded(self, day):
+        """
+        Returns whether the commits of day have been read
+        """
+        return self._complete or day.toordinal() in self._loaded_days
+
+    def load(self, day):
+        """
+        Reads the commits of day, if it has any and they aren't read yet
+        """
+        ordinal = day.toordinal()
+        if self.is_loaded(day) or not self._day_counts().get(ordinal):
+            return
+        #  the committer's local day spans from UTC-14 to UTC+14, so read a day
+        #  either side and keep only the commits dated on that day
+        records = self._read_log(day - datetime.timedelta(days=1),
+                                 day + datetime.timedelta(days=2))
+        self._loaded.extend(self._keep(records, days=(ordinal,)))
+        self._loaded_days.add(ordinal)
+
+    def load_all(self):
+        """
+        Reads the commits of every day
+        """
+        if self._complete:
+            return
+        loaded = CommitStore()
+        loaded.extend(self._keep(self._read_log(None, None)))
+        self._loaded = loaded
+        self._complete = True
+
+    def select(self, day_filter):
+        """
+        Returns a new store with the commits whose day passes day_filter
+
+        :param day_filter: callable taking a day ordinal
+        """
+        if self._day_filter is not None:
+            previous = self._day_filter
+            combined = lambda day: previous(day) and day_filter(day)
+        else:
+            combined = day_filter
+        selected = LazyCommitStore(self._read_log, combined)
+        selected.days.extend(day for day in self.days if day_filter(day))
+        selected._loaded = self._loaded.select(day_filter)
+        selected._loaded_days = set(self._loaded_days)
+        selected._complete = self._complete
+        return selected
+
+    def top_authors(self, n=5, day=None):
+        """
+        Returns a list of (author, number of commits) of the top n committers,
+        of all commits or of the commits on day
+        """
+        if day is None:
+            self.load_all()
+        else:
+            self.load(day)
+        return self._loaded.top_authors(n, day)
+
+    def count(self, day):
+        """
+        Returns the number of commits on day
+        """
+        return self._day_counts().get(day.toordinal(), 0)
+
+    def rows(self, day):
+        """
+        Reads the commits of day if needed, and returns their rows, to build each
+        with `commit`. Rows stay valid until `load_all`
+        """
+        self.load(day)
+        return self._loaded.rows(day)
+
+    def commit(self, row):
+        """
+        Builds the `Commit` stored at a row returned by `rows`
+        """
+        return self._loaded.commit(row)
+
+    def get(self, day, default=None):
+        """
+        Returns the list of commits on day, or default if there are none
+        """
+        self.load(day)
+        return self._loaded.get(day, default)
+
+    def __getitem__(self, day):
+        return self.get(day, [])
+
+    def __contains__(self, day):
+        return day.toordinal() in self._day_counts()
+
+    def __iter__(self):
+        for day in self._day_counts():
+            yield datetime.date.fromordinal(day)
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[day] for day in self]
+
+    def items(self):
+        return [(day, self[day]) for day in self]
+
+    def __len__(self):
+        """
+        Returns the number of days with commits
+        """
+        return len(self._day_counts())
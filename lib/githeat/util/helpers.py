@@ -4,74 +4,43 @@
 from __future__ import absolute_import
 
 import calendar
-import math
 
 import datetime
-from operator import itemgetter
 
 import unicodedata
 
+from . import normalize
 
-def normalize_dict(dictionary, x, y):
+
+def normalize_dict(dictionary, x, y, scale='linear'):
     """
     Normalize values in dictinoary to be in range [x, y]
 
     :param dictionary:
     :param x: range min
     :param y: range max
-    :return: dict with values changed accordingly
+    :param scale: one of normalize.SCALES
+    :return: new dict with values changed accordingly
     """
-    min_value = min(dictionary.values())
-    max_value = max(dictionary.values())
-    if max_value <= y and min_value >= x:
-        return dictionary
-
-    #  normalize to [0, 1]
-    range1 = max_value - min_value
-    if not range1:
-        range1 = 1
-    for key in dictionary:
-        dictionary[key] = (float(dictionary[key]) - min_value) / range1
-
-    # then scale [x,y] and take ceiling
-    range2 = y - x
-    for key in dictionary:
-        dictionary[key] = math.ceil((float(dictionary[key]) * range2) + x)
-
-    return dictionary
+    keys = list(dictionary)
+    values = normalize.normalize([dictionary[k] for k in keys], x, y, scale)
+    normalized = dictionary.copy()  # keeps the type, e.g. defaultdict
+    normalized.update(zip(keys, values))
+    return normalized
 
 
-def normalize_tuple_list(tuple_list, x, y):
+def normalize_tuple_list(tuple_list, x, y, scale='linear'):
     """
     Normalize values in a list of tuples to be in range [x, y]
 
     :param tuple_list:
     :param x: range min
     :param y: range max
-    :return: list of tuples with values changed accordingly
+    :param scale: one of normalize.SCALES
+    :return: new list of tuples with values changed accordingly
     """
-    min_value = min(tuple_list, key=itemgetter(1))[1]
-    max_value = max(tuple_list, key=itemgetter(1))[1]
-    if max_value <= y and min_value >= x:
-        return tuple_list
-
-    #  normalize to [0, 1]
-    range1 = max_value - min_value
-    if not range1:
-        range1 = 1
-    for idx, pair in enumerate(tuple_list):
-        key = pair[0]
-        value = (float(pair[1]) - min_value) / range1
-        tuple_list[idx] = (key, value)
-
-    # then scale [x,y] and take ceiling
-    range2 = y - x
-    for idx, pair in enumerate(tuple_list):
-        key = pair[0]
-        value = math.ceil((float(pair[1]) * range2) + x)
-        tuple_list[idx] = (key, value)
-
-    return tuple_list
+    values = normalize.normalize([pair[1] for pair in tuple_list], x, y, scale)
+    return [(pair[0], value) for pair, value in zip(tuple_list, values)]
 
 
 def get_months(start_date, months, include_year=False):
@@ -122,7 +91,7 @@ def remove_accents(input_str):
     """
     nfkd_form = unicodedata.normalize('NFKD', input_str)
     only_ascii = nfkd_form.encode('ASCII', 'ignore')
-    return str(only_ascii)
+    return only_ascii.decode('ASCII')
 
 
 def first(iterable, func=lambda L: L is not None, **kwargs):
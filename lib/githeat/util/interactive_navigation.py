@@ -6,88 +6,118 @@ import collections
 
 Cursor = collections.namedtuple('Cursor', ('y', 'x', 'term'))
 
-above = lambda csr, n: (
-    Cursor(y=max(0, csr.y - n),
-           x=csr.x,
-           term=csr.term))
+lookup_move = lambda inp_code, term: {
+    # arrows, including angled directionals, as (rows, weeks) to move by
+    term.KEY_END: (1, -1),
+    term.KEY_KP_1: (1, -1),
 
-below = lambda csr, n: (
-    Cursor(y=min(csr.term.height - 1, csr.y + n),
-           x=csr.x,
-           term=csr.term))
+    term.KEY_DOWN: (1, 0),
+    term.KEY_KP_2: (1, 0),
 
-right_of = lambda csr, n: (
-    Cursor(y=csr.y,
-           x=min(csr.term.width - 1, csr.x + n),
-           term=csr.term))
+    term.KEY_PGDOWN: (1, 1),
+    term.KEY_LR: (1, 1),
+    term.KEY_KP_3: (1, 1),
 
-left_of = lambda csr, n: (
-    Cursor(y=csr.y,
-           x=max(0, csr.x - n),
-           term=csr.term))
+    term.KEY_LEFT: (0, -1),
+    term.KEY_KP_4: (0, -1),
 
-home = lambda csr: (
-    Cursor(y=csr.y,
-           x=0,
-           term=csr.term))
+    term.KEY_RIGHT: (0, 1),
+    term.KEY_KP_6: (0, 1),
 
-end = lambda csr: (
-    Cursor(y=csr.y,
-           x=csr.term.width - 1,
-           term=csr.term))
+    term.KEY_HOME: (-1, -1),
+    term.KEY_KP_7: (-1, -1),
 
-bottom = lambda csr: (
-    Cursor(y=csr.term.height - 1,
-           x=csr.x,
-           term=csr.term))
+    term.KEY_UP: (-1, 0),
+    term.KEY_KP_8: (-1, 0),
 
-top = lambda csr: (
-    Cursor(y=0,
-           x=csr.x,
-           term=csr.term))
-
-center = lambda csr: Cursor(
-        csr.term.height // 2,
-        csr.term.width // 2,
-        csr.term)
-
-lookup_move = lambda inp_code, csr, term, githeat: {
-    # arrows, including angled directionals
-    csr.term.KEY_END: below(left_of(csr, 1), 1),
-    csr.term.KEY_KP_1: below(left_of(csr, 1), 1),
-
-    csr.term.KEY_DOWN: below(csr, 1),
-    csr.term.KEY_KP_2: below(csr, 1),
-
-    csr.term.KEY_PGDOWN: below(right_of(csr, 1), 1),
-    csr.term.KEY_LR: below(right_of(csr, 1), 1),
-    csr.term.KEY_KP_3: below(right_of(csr, 1), 1),
-
-    csr.term.KEY_LEFT: left_of(csr, len(githeat.width)),
-    csr.term.KEY_KP_4: left_of(csr, len(githeat.width)),
-
-    csr.term.KEY_CENTER: center(csr),
-    csr.term.KEY_KP_5: center(csr),
-
-    csr.term.KEY_RIGHT: right_of(csr, len(githeat.width)),
-    csr.term.KEY_KP_6: right_of(csr, len(githeat.width)),
-
-    csr.term.KEY_HOME: above(left_of(csr, 1), 1),
-    csr.term.KEY_KP_7: above(left_of(csr, 1), 1),
-
-    csr.term.KEY_UP: above(csr, 1),
-    csr.term.KEY_KP_8: above(csr, 1),
-
-    csr.term.KEY_PGUP: above(right_of(csr, 1), 1),
-    csr.term.KEY_KP_9: above(right_of(csr, 1), 1),
+    term.KEY_PGUP: (-1, 1),
+    term.KEY_KP_9: (-1, 1),
 
     # shift + arrows
-    csr.term.KEY_SLEFT: left_of(csr, 9),
-    csr.term.KEY_SRIGHT: right_of(csr, 9),
-    csr.term.KEY_SDOWN: below(csr, 4),
-    csr.term.KEY_SUP: above(csr, 4),
-
-    # carriage return
-    # csr.term.KEY_ENTER: home(below(csr, 1)),
-}.get(inp_code, csr)
+    term.KEY_SLEFT: (0, -4),
+    term.KEY_SRIGHT: (0, 4),
+    term.KEY_SDOWN: (4, 0),
+    term.KEY_SUP: (-4, 0),
+}.get(inp_code)
+
+
+class DayGrid:
+    """
+    Index of the graph cells holding a day, with the neighbours of each cell, so
+    the cursor moves to the next day in any direction without scanning the
+    screen. Moving left or right skips the empty cells between months, up or
+    down only moves to the cell right above or below
+    """
+
+    def __init__(self, screen_dates):
+        """
+        :param screen_dates: dict of (y, x) to the date drawn there, or None
+        """
+        self.days = {}  # (y, x) -> date
+        self.positions = {}  # date -> (y, x)
+        rows = {}  # y -> sorted x of the cells holding a day
+        for (y, x), day in screen_dates.items():
+            if day is not None:
+                self.days[y, x] = day
+                self.positions[day] = (y, x)
+                rows.setdefault(y, []).append(x)
+
+        #  (y, x) -> ((y, x) left, right, above, below), None at the edges
+        self.neighbours = {}
+        for y, xs in rows.items():
+            xs.sort()
+            for idx, x in enumerate(xs):
+                above, below = (y - 1, x), (y + 1, x)
+                self.neighbours[y, x] = (
+                    (y, xs[idx - 1]) if idx else None,
+                    (y, xs[idx + 1]) if idx + 1 < len(xs) else None,
+                    above if above in self.days else None,
+                    below if below in self.days else None)
+        self.rows = rows
+
+    def day(self, position):
+        """
+        Returns the date at (y, x), or None
+        """
+        return self.days.get(position)
+
+    def move(self, position, rows, weeks):
+        """
+        Returns the position rows down and weeks right of position, going as far
+        as there are days in each direction, or None if it can't move at all
+
+        :param position: (y, x) of a cell holding a day
+        :param rows: rows to move by, negative to move up
+        :param weeks: weeks to move by, negative to move left
+        """
+        target = position
+        for step, count in ((0 if weeks < 0 else 1, abs(weeks)),
+                            (2 if rows < 0 else 3, abs(rows))):
+            for _ in range(count):
+                neighbour = self.neighbours[target][step]
+                if neighbour is None:
+                    break
+                target = neighbour
+        return None if target == position else target
+
+    def replay(self, position, steps):
+        """
+        Returns the position reached by making each move of steps in turn, or
+        None if it doesn't move at all. Edges stop each move on its own, so the
+        steps can't be added up into one move
+
+        :param position: (y, x) of a cell holding a day
+        :param steps: iterable of (rows, weeks), see `move`
+        """
+        target = position
+        for rows, weeks in steps:
+            target = self.move(target, rows, weeks) or target
+        return None if target == position else target
+
+    def center(self, y):
+        """
+        Returns the position of the middle day in row y, or None
+        """
+        xs = self.rows.get(y)
+        return (y, xs[len(xs) // 2]) if xs else None
 
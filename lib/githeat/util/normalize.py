@@ -0,0 +1,118 @@
+""" Scaling of contribution counts into color levels.
+
+Every scale takes a sequence of counts and returns a new list of integer levels
+in [x, y], leaving its input untouched:
+
+  linear - (the default) min-max scaling, counts already in [x, y] are kept as is
+  log - min-max scaling of log(1 + count), so a few very busy days don't flatten
+        the rest of the heatmap
+  quantile - zero stays at x and the other counts are split into y - x equally
+             sized groups by rank
+
+NumPy is used when it is installed.
+
+"""
+from __future__ import absolute_import
+
+from bisect import bisect_right
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+__all__ = "SCALES", "normalize", "linear", "log", "quantile"
+
+
+def _min_max(values, x, y):
+    """
+    Scales values from [min, max] to [x, y], taking the ceiling
+    """
+    min_value = min(values)
+    range1 = (max(values) - min_value) or 1
+    range2 = y - x
+    if np is not None:
+        scaled = np.ceil((np.asarray(values, dtype=float) - min_value) / range1 * range2
+                         + x)
+        return scaled.astype(int).tolist()
+    return [int(math.ceil((float(v) - min_value) / range1 * range2 + x))
+            for v in values]
+
+
+def linear(counts, x, y):
+    """
+    Normalize counts to be in range [x, y]
+
+    :param counts: sequence of counts
+    :param x: range min
+    :param y: range max
+    :return: list of levels
+    """
+    if not len(counts):
+        return []
+    if max(counts) <= y and min(counts) >= x:
+        return [int(c) for c in counts]
+    return _min_max(counts, x, y)
+
+
+def log(counts, x, y):
+    """
+    Normalize log(1 + count) of counts to be in range [x, y]
+
+    :param counts: sequence of counts
+    :param x: range min
+    :param y: range max
+    :return: list of levels
+    """
+    if not len(counts):
+        return []
+    if np is not None:
+        return _min_max(np.log1p(np.asarray(counts, dtype=float)), x, y)
+    return _min_max([math.log1p(c) for c in counts], x, y)
+
+
+def quantile(counts, x, y):
+    """
+    Bucket counts into levels in range [x, y] by rank, zero counts get x
+
+    :param counts: sequence of counts
+    :param x: range min
+    :param y: range max
+    :return: list of levels
+    """
+    levels = y - x
+    if np is not None:
+        counts = np.asarray(counts)
+        non_zero = np.sort(counts[counts > 0])
+        if not len(non_zero):
+            return [x] * len(counts)
+        thresholds = non_zero[[k * len(non_zero) // levels for k in range(1, levels)]]
+        scaled = x + 1 + np.searchsorted(thresholds, counts, side='right')
+        return np.where(counts > 0, scaled, x).tolist()
+
+    non_zero = sorted(c for c in counts if c > 0)
+    if not non_zero:
+        return [x] * len(counts)
+    thresholds = [non_zero[k * len(non_zero) // levels] for k in range(1, levels)]
+    return [x + 1 + bisect_right(thresholds, c) if c > 0 else x for c in counts]
+
+
+SCALES = {
+    'linear': linear,
+    'log': log,
+    'quantile': quantile,
+}
+
+
+def normalize(counts, x, y, scale='linear'):
+    """
+    Normalize counts to levels in range [x, y] using the named scale
+
+    :param counts: sequence of counts
+    :param x: range min
+    :param y: range max
+    :param scale: one of SCALES
+    :return: list of levels
+    """
+    return SCALES[scale](counts, x, y)
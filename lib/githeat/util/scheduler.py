@@ -0,0 +1,96 @@
+""" Input scheduling for interactive githeat.
+
+Holding an arrow key makes the terminal repeat it faster than a slow terminal,
+or one over SSH, can show the moves, and each queued key used to be drawn in
+turn, so the cursor kept sliding after the key was released. `InputScheduler`
+reads every key that is already waiting, groups consecutive moves so the
+cursor is drawn once for them, and returns them at most once per frame.
+
+"""
+from __future__ import absolute_import
+
+import collections
+import time
+
+__all__ = "InputScheduler", "Move"
+
+FRAME_RATE = 30  # frames per second
+
+#  keys read in a single frame, so a flood of input can't hold a frame back
+MAX_KEYS = 256
+
+#  (rows, weeks) of each movement key, in the order they were pressed. They are
+#  kept apart because moves stopped by an edge don't add up
+Move = collections.namedtuple('Move', ('steps',))
+
+
+class InputScheduler:
+    """
+    Reads keys from a blessed Terminal a frame at a time
+    """
+
+    def __init__(self, term, lookup_move, frame_rate=FRAME_RATE, max_keys=MAX_KEYS,
+                 clock=time.time):
+        """
+        :param term: blessed Terminal
+        :param lookup_move: callable taking a key code and the terminal, and
+                            returning the (rows, weeks) it moves by, or None,
+                            see `interactive_navigation.lookup_move`
+        :param frame_rate: maximum number of frames per second
+        :param max_keys: maximum number of keys read in a frame
+        :param clock: callable returning the current time in seconds
+        """
+        self.term = term
+        self.lookup_move = lookup_move
+        self.frame_time = 1.0 / frame_rate
+        self.max_keys = max_keys
+        self.clock = clock
+        self._last_frame = None
+
+    def read(self, timeout=None):
+        """
+        Waits up to timeout seconds for a key, then reads the keys pressed until
+        the next frame is due
+
+        :param timeout: seconds to wait for the first key, None to wait for ever
+        :return: list of events for the frame, in the order they were pressed,
+                 each a `Move` of consecutive movement keys or a Keystroke
+        """
+        key = self.term.inkey(timeout=timeout)
+        if not key:
+            return []
+        keys = [key]
+
+        #  keep reading until the frame is due, then whatever is left waiting
+        now = self.clock()
+        if self._last_frame is not None:
+            wait = self._last_frame + self.frame_time - now
+            while wait > 0 and len(keys) < self.max_keys:
+                key = self.term.inkey(timeout=wait)
+                if key:
+                    keys.append(key)
+                wait = self._last_frame + self.frame_time - self.clock()
+        while len(keys) < self.max_keys:
+            key = self.term.inkey(timeout=0)
+            if not key:
+                break
+            keys.append(key)
+        self._last_frame = self.clock()
+
+        return self.coalesce(keys)
+
+    def coalesce(self, keys):
+        """
+        Returns the events of keys, with consecutive movement keys grouped into
+        one `Move`
+        """
+        events = []
+        for key in keys:
+            move = self.lookup_move(key.code, self.term)
+            if move is None:
+                events.append(key)
+            elif events and isinstance(events[-1], Move):
+                events[-1].steps.append(move)
+            else:
+                events.append(Move([move]))
+        return events
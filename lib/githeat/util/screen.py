@@ -0,0 +1,127 @@
+""" Screen buffer for interactive githeat.
+
+Records the text drawn at each (y, x) of the terminal, so it can be drawn
+again after another view covered it. Cells are indexed by row, and the rows
+and the columns of each row are kept sorted as they are added. Walking the
+buffer, or only a region of it, therefore doesn't sort or scan every cell, and
+the bounds of what was drawn are kept up to date as cells are added.
+
+"""
+from __future__ import absolute_import
+
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # python 2
+    from collections import MutableMapping
+
+__all__ = "ScreenBuffer",
+
+
+class ScreenBuffer(MutableMapping):
+    """
+    Mapping of (y, x) to the text drawn there, iterated in row then column order
+    """
+
+    def __init__(self):
+        self._rows = {}  # y -> {x: text}
+        self._columns = {}  # y -> sorted list of the row's x
+        self._ys = []  # sorted y of the rows with cells
+        self._len = 0
+        self._bounds = None  # (top, left, bottom, right), None when empty
+        self._stale_bounds = False  # a cell was removed since they were set
+
+    def __setitem__(self, key, value):
+        y, x = key
+        row = self._rows.get(y)
+        if row is None:
+            row = self._rows[y] = {}
+            self._columns[y] = []
+            insort(self._ys, y)
+        if x not in row:
+            insort(self._columns[y], x)
+            self._len += 1
+            if self._bounds is None:
+                if not self._stale_bounds:
+                    self._bounds = (y, x, y, x)
+            else:
+                top, left, bottom, right = self._bounds
+                self._bounds = (min(top, y), min(left, x),
+                                max(bottom, y), max(right, x))
+        row[x] = value
+
+    def __getitem__(self, key):
+        y, x = key
+        try:
+            return self._rows[y][x]
+        except KeyError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        row = self._rows.get(key[0])
+        if row is None:
+            return default
+        return row.get(key[1], default)
+
+    def __delitem__(self, key):
+        y, x = key
+        row = self._rows.get(y)
+        if row is None or x not in row:
+            raise KeyError(key)
+        del row[x]
+        columns = self._columns[y]
+        del columns[bisect_left(columns, x)]
+        if not row:
+            del self._rows[y]
+            del self._columns[y]
+            del self._ys[bisect_left(self._ys, y)]
+        self._len -= 1
+        self._bounds = None
+        self._stale_bounds = bool(self._len)
+
+    def __iter__(self):
+        for y in self._ys:
+            for x in self._columns[y]:
+                yield y, x
+
+    def __len__(self):
+        return self._len
+
+    def clear(self):
+        self.__init__()
+
+    def bounds(self):
+        """
+        Returns (top, left, bottom, right) of the cells drawn, or None if empty
+        """
+        if self._stale_bounds:
+            self._bounds = (self._ys[0],
+                            min(columns[0] for columns in self._columns.values()),
+                            self._ys[-1],
+                            max(columns[-1] for columns in self._columns.values()))
+            self._stale_bounds = False
+        return self._bounds
+
+    def row(self, y):
+        """
+        Returns a list of (x, text) of the cells in row y, from left to right
+        """
+        row = self._rows.get(y)
+        if row is None:
+            return []
+        return [(x, row[x]) for x in self._columns[y]]
+
+    def region(self, top, left, bottom, right):
+        """
+        Yields ((y, x), text) of the cells from top left to bottom right, both
+        included, in row then column order
+        """
+        ys = self._ys
+        for y in ys[bisect_left(ys, top):bisect_right(ys, bottom)]:
+            row = self._rows[y]
+            columns = self._columns[y]
+            for x in columns[bisect_left(columns, left):bisect_right(columns, right)]:
+                yield (y, x), row[x]
@@ -0,0 +1,56 @@
+""" Terminal geometry.
+
+The width of the terminal is read from the COLUMNS environment variable or
+queried from the terminal driver, without spawning `stty`. When stdout isn't a
+terminal (pipes, cron, CI) the width is unknown and None is returned, so output
+isn't cut to an arbitrary size.
+
+"""
+from __future__ import absolute_import
+
+import os
+import struct
+import sys
+
+try:
+    from shutil import get_terminal_size
+except ImportError:  # Python 2
+    get_terminal_size = None
+
+
+def _ioctl_columns(fd):
+    """
+    Returns the columns of the terminal on fd using the TIOCGWINSZ ioctl
+
+    :param fd: file descriptor
+    :return: number of columns, 0 if unknown
+    """
+    import fcntl
+    import termios
+    rows_columns = fcntl.ioctl(fd, termios.TIOCGWINSZ, b'\0' * 4)
+    return struct.unpack('hh', rows_columns)[1]
+
+
+def terminal_columns(columns=None, stream=None):
+    """
+    Returns the width of the terminal
+
+    :param columns: explicit width, returned as is when given
+    :param stream: stream the output is written to, sys.stdout by default
+    :return: number of columns, or None if stream isn't a terminal
+    """
+    if columns is not None:
+        return columns
+
+    stream = stream or sys.stdout
+    try:
+        if not stream.isatty():
+            return None
+        if get_terminal_size is not None:
+            #  honors COLUMNS, falls back to 0 if the size can't be read
+            width = get_terminal_size(fallback=(0, 0)).columns
+        else:
+            width = int(os.environ.get('COLUMNS', 0)) or _ioctl_columns(stream.fileno())
+    except (AttributeError, ValueError, IOError, OSError, ImportError):
+        return None
+    return width or None
@@ -50,6 +50,9 @@ _CONFIG = {
         "wheel",
         "xtermcolor",
     ],
+    "extras_require": {
+        "numpy": ["numpy"],
+    },
     "tests_require": [
         "pytest>=2.9"
         "pytest-cov"
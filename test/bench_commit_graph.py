@@ -0,0 +1,69 @@
+""" History reading benchmark.
+
+Times reading one year of commits from a repository through a `git log`
+subprocess, through the object database reader, and through the object database
+reader with the commit-graph file; both for a full read and for the incremental
+'tip..HEAD' read the commit cache does when a few commits were added. Write the
+commit-graph first with
+
+    git commit-graph write --reachable
+
+then run it from the test directory against a large repository:
+
+    python bench_commit_graph.py /path/to/repo
+
+"""
+from __future__ import print_function
+
+import datetime
+import sys
+import time
+
+from git import Git
+
+from githeat import gitlog
+from githeat import odb
+from githeat.githeat import Githeat
+
+REPEAT = 5
+
+#  commits added since the cached tip in the incremental read
+NEW_COMMITS = 10
+
+
+def best_of(read, repeat=REPEAT):
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        count = sum(1 for _ in read())
+        timings.append(time.time() - start)
+    return min(timings), count
+
+
+def main(argv=None):
+    path = (argv or sys.argv[1:] or ['.'])[0]
+    githeat = Githeat(Git(path))
+    since = gitlog.since_date(datetime.datetime.now())
+    since = time.mktime(since.timetuple())
+
+    if odb.ObjectDatabase(path).graph is None:
+        print("no commit-graph, run 'git commit-graph write --reachable'")
+
+    def object_database(commit_graph, revision):
+        return lambda: odb.ObjectDatabase(path, commit_graph=commit_graph).log(
+            since=since, revision=revision)
+
+    tip = Git(path).rev_parse('HEAD~{}'.format(NEW_COMMITS))
+    for revision in (None, '{}..HEAD'.format(tip)):
+        print(revision or 'HEAD')
+        readers = (("git log", lambda: githeat.read_git_log(revision)),
+                   ("object database", object_database(False, revision)),
+                   ("commit-graph", object_database(True, revision)))
+        for name, read in readers:
+            seconds, count = best_of(read)
+            print("  {:<16} {:>8.1f} ms, {} commits".format(name, seconds * 1000,
+                                                            count))
+
+
+if __name__ == "__main__":
+    main()
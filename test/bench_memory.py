@@ -0,0 +1,87 @@
+""" Memory benchmark for commit storage.
+
+Loads the test log fixture scaled up 100x (400,000 commits) into a dict of
+plain object lists, the way commits_db used to be built, a dict of slotted
+`Commit` lists and a `CommitStore`, and reports the memory each one holds.
+Run it from the test directory:
+
+    python bench_memory.py
+
+Requires Python 3 for tracemalloc.
+
+"""
+from collections import defaultdict
+import gc
+import tracemalloc
+
+from githeat import gitlog
+from githeat.store import Commit
+from githeat.store import CommitStore
+from static.test_logs import log_stream
+
+SCALE = 100
+
+
+def _records():
+    records = []
+    for record in gitlog.iter_records(log_stream()):
+        fields = gitlog.parse_record(record)
+        fields[1] = gitlog.parse_commit_date(fields[1])
+        records.append(fields)
+    for _ in range(SCALE):
+        for fields in records:
+            #  fresh strings per copy, as if each commit was read from git
+            yield [(s + ".")[:-1] if isinstance(s, str) else s for s in fields]
+
+
+class _PlainCommit:
+    def __init__(self, abbr_commit_hash, date, author, author_email, subject):
+        self.abbr_commit_hash = abbr_commit_hash
+        self.date = date
+        self.author = author
+        self.author_email = author_email
+        self.subject = subject
+
+
+def _commit_lists(commit_class):
+    commits_db = defaultdict(list)
+    for abbr_commit_hash, date, author, author_email, subject in _records():
+        commits_db[date.date()].append(commit_class(abbr_commit_hash, date, author,
+                                                    author_email, subject))
+    return commits_db
+
+
+def _commit_store():
+    commits_db = CommitStore()
+    commits_db.extend(_records())
+    return commits_db
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def _report(name, size, count):
+    print("{:<24} {:>8.1f} MiB, {:>5.0f} bytes/commit".format(
+            name, size / 2.0 ** 20, size / float(count)))
+
+
+def main():
+    for name, commit_class in (("dict of plain objects", _PlainCommit),
+                               ("dict of slotted Commits", Commit)):
+        commits, size = measure(lambda: _commit_lists(commit_class))
+        _report(name, size, sum(len(c) for c in commits.values()))
+        del commits
+
+    commits, size = measure(_commit_store)
+    _report("CommitStore", size, len(commits.days))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import subprocess
+
+
+def git_repo(path, author, commits):
+    """
+    Creates a git repository at path with a number of empty commits by author
+    """
+    subprocess.check_call(["git", "init", "-q", str(path)])
+    for idx in range(commits):
+        subprocess.check_call(["git", "-C", str(path),
+                               "-c", "user.name={}".format(author),
+                               "-c", "user.email={}@example.com".format(author),
+                               "commit", "-q", "--allow-empty",
+                               "-m", "commit {}".format(idx)])
+    return str(path)
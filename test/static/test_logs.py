@@ -3998,4 +3998,13 @@ test_logs =\
     u"a8546e9{0}2015-12-09 12:03:19{0}Christopher Cooper{0}jonesarthur@diaz.com{0}Reprehenderit odit odit laudantium.\n"\
     u"6f9d8cb{0}2015-07-04 14:51:03{0}John Moore{0}ghale@yahoo.com{0}Aliquid delectus mollitia ratione repudiandae architecto.\n"\
     u"a4565a0{0}2015-08-30 18:19:29{0}Shannon Payne{0}heatherjohnson@yahoo.com{0}Unde rem nulla repellat temporibus.\n"\
-    u"e369f3d{0}2016-01-20 16:31:33{0}John Ortiz{0}samantha44@yahoo.com{0}Illo tempore distinctio praesentium illum fugiat".format("<githeat_delimeter>")
\ No newline at end of file
+    u"e369f3d{0}2016-01-20 16:31:33{0}John Ortiz{0}samantha44@yahoo.com{0}Illo tempore distinctio praesentium illum fugiat".format("<githeat_delimeter>")
+
+
+def log_stream(logs=test_logs):
+    """
+    Returns `logs` as the NUL separated byte stream produced by `git log -z`
+    """
+    import io
+    records = logs.replace(u"<githeat_delimeter>", u"\x1f").replace(u"\n", u"\x00")
+    return io.BytesIO(records.encode('utf-8'))
@@ -0,0 +1,49 @@
+""" Test suite for the asynclog module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import pytest
+
+from githeat import asynclog
+from static.git_repos import git_repo
+
+
+@pytest.mark.parametrize("concurrency", [1, None])
+def test_collect(tmpdir, concurrency):
+    paths = [git_repo(tmpdir.join("first"), "James", 3),
+             git_repo(tmpdir.join("second"), "John", 2),
+             str(tmpdir.join("missing")),
+             str(tmpdir.mkdir("empty")),
+             str(tmpdir.join("first").mkdir("docs"))]  # inside a repository
+
+    commits = asynclog.collect(paths, concurrency=concurrency)
+    assert len(commits.days) == 5
+    assert commits.top_authors() == [("James", 3), ("John", 2)]
+
+    commits = asynclog.collect(paths, author="John")
+    assert commits.top_authors() == [("John", 2)]
+
+
+def test_read_repo_small_chunks(tmpdir):
+    path = git_repo(tmpdir.join("repo"), "James", 4)
+    args = asynclog.gitlog.log_args()
+
+    async def read():
+        return await asynclog.read_repo(path, args, asynclog.asyncio.Semaphore(1),
+                                        chunk_size=7)
+
+    commits = asynclog.asyncio.run(read())
+    assert [commits.commit(row).subject for row in range(4)] == ["commit 3",
+                                                                 "commit 2",
+                                                                 "commit 1",
+                                                                 "commit 0"]
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
@@ -0,0 +1,123 @@
+""" Test suite for the cache module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import datetime
+import os
+
+import pytest
+from git.exc import GitCommandError
+from mock import Mock
+
+from githeat.cache import Cache
+
+NOW = datetime.datetime.now()
+
+
+def _record(abbr_commit_hash, days_ago):
+    return [abbr_commit_hash, NOW - datetime.timedelta(days=days_ago),
+            "Katrina Grimes", "k@espinoza.com", "Veniam fuga ullam."]
+
+
+RECORDS = [_record("79c4705", 1), _record("e90f07a", 10)]
+
+
+def _repo(head, ancestor=True):
+    merge_base = Mock()
+    if not ancestor:
+        merge_base.side_effect = GitCommandError("merge-base", 1)
+    return Mock(rev_parse=Mock(return_value="/repo\n{}".format(head)),
+                merge_base=merge_base)
+
+
+def _read_log(records):
+    return Mock(side_effect=lambda revision: list(records))
+
+
+def _hashes(commits):
+    return [commits.commit(row).abbr_commit_hash for row in range(len(commits.days))]
+
+
+HASHES = ["79c4705", "e90f07a"]
+
+
+def test_cache_roundtrip(tmpdir):
+    cache = Cache(_repo("abc"), directory=str(tmpdir))
+    assert cache.load() is None
+    read_log = _read_log(RECORDS)
+    assert _hashes(cache.commits(read_log)) == HASHES
+    read_log.assert_called_once_with(None)
+
+    read_log = _read_log([])
+    commits = Cache(_repo("abc"), directory=str(tmpdir)).commits(read_log)
+    assert _hashes(commits) == HASHES
+    assert not read_log.called
+
+
+def test_cache_keyed_by_filters(tmpdir):
+    Cache(_repo("abc"), directory=str(tmpdir)).commits(_read_log(RECORDS))
+    assert Cache(_repo("abc"), author="Will", directory=str(tmpdir)).load() is None
+    assert Cache(_repo("abc"), grep="Fix", directory=str(tmpdir)).load() is None
+    assert Cache(_repo("abc"), backend="odb", directory=str(tmpdir)).load() is None
+
+
+def test_cache_incremental_update(tmpdir):
+    Cache(_repo("abc"), directory=str(tmpdir)).commits(_read_log(RECORDS))
+
+    new_record = _record("bffe462", 0)
+    read_log = _read_log([new_record])
+    commits = Cache(_repo("def"), directory=str(tmpdir)).commits(read_log)
+    read_log.assert_called_once_with("abc..def")
+    assert _hashes(commits) == ["bffe462"] + HASHES
+    assert Cache(_repo("def"), directory=str(tmpdir)).load()['tip'] == "def"
+
+
+def test_cache_rewritten_history(tmpdir):
+    Cache(_repo("abc"), directory=str(tmpdir)).commits(_read_log(RECORDS))
+
+    read_log = _read_log(RECORDS[1:])
+    cache = Cache(_repo("def", ancestor=False), directory=str(tmpdir))
+    assert _hashes(cache.commits(read_log)) == HASHES[1:]
+    read_log.assert_called_once_with(None)
+
+
+def test_cache_expires_old_records(tmpdir):
+    old_record = _record("069759b", 400)
+    commits = Cache(_repo("abc"), directory=str(tmpdir)).commits(
+            _read_log(RECORDS + [old_record]))
+    assert _hashes(commits) == HASHES
+
+    later = (NOW + datetime.timedelta(days=370)).date()
+    commits = Cache(_repo("abc"), directory=str(tmpdir)).commits(_read_log([]),
+                                                                 today=later)
+    assert _hashes(commits) == HASHES[:1]
+    assert _hashes(Cache(_repo("abc"), directory=str(tmpdir)).load()['commits']) == \
+        HASHES[:1]
+
+
+def test_cache_without_head(tmpdir):
+    repo = Mock(rev_parse=Mock(side_effect=GitCommandError("rev-parse", 128)))
+    cache = Cache(repo, directory=str(tmpdir))
+    assert _hashes(cache.commits(_read_log(RECORDS))) == HASHES
+    assert cache.load() is None
+    assert not tmpdir.listdir()
+
+
+def test_cache_failed_save_leaves_no_temp_file(tmpdir, monkeypatch):
+    def rename(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "rename", rename)
+    cache = Cache(_repo("abc"), directory=str(tmpdir))
+    assert _hashes(cache.commits(_read_log(RECORDS))) == HASHES
+    assert not tmpdir.listdir()
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
@@ -0,0 +1,58 @@
+""" Test suite for the contributions module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+from array import array
+import datetime
+
+import pytest
+
+from githeat import contributions
+
+SUNDAY = datetime.date(2015, 10, 4)
+FIRST = SUNDAY.toordinal()
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        if contributions.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(contributions, "np", None)
+    return request.param
+
+
+def test_count_by_day(engine):
+    days = array('l', [FIRST, FIRST, FIRST + 1, FIRST + 30, FIRST - 1, FIRST + 31])
+    counts = contributions.count_by_day(days, FIRST, FIRST + 30)
+    assert len(counts) == 31
+    assert counts[:3] == [2, 1, 0]
+    assert counts[30] == 1
+    assert sum(counts) == 4
+
+
+def test_filter_counts(engine):
+    counts = [1] * 35
+    assert contributions.filter_counts(counts, FIRST) == counts
+
+    sundays = contributions.filter_counts(counts, FIRST, weekdays=[0])
+    assert [i for i, c in enumerate(sundays) if c] == [0, 7, 14, 21, 28]
+
+    november = contributions.filter_counts(counts, FIRST,
+                                           months=[datetime.date(2015, 11, 1)])
+    assert [i for i, c in enumerate(november) if c] == list(range(28, 35))
+
+    both = contributions.filter_counts(counts, FIRST, weekdays=[0],
+                                       months=[datetime.date(2015, 11, 1)])
+    assert [i for i, c in enumerate(both) if c] == [28]
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
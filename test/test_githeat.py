@@ -7,18 +7,26 @@ precedence over the version in this project directory. Use a virtualenv test
 environment or setuptools develop mode to test against the development version.
 
 """
+from collections import Counter
 import datetime
+import sys
 import pytest
 from mock import Mock
 
-from githeat.githeat import Githeat, Commit
-from static.test_logs import test_logs
+from xtermcolor import colorize
+
+from githeat.githeat import Githeat
+from githeat.store import CommitStore
+from githeat.util.helpers import normalize_tuple_list
+from githeat.palette import get_palette
+from githeat import contributions
+from static.test_logs import log_stream
 
 @pytest.fixture
 def test_repo():
 
-    def log(arguments):
-        return test_logs
+    def log(arguments, as_process=False):
+        return Mock(stdout=log_stream())
 
     repo = Mock(log=log)
     githeat = Githeat(repo)
@@ -79,6 +87,28 @@ def test_compute_daily_contribution_map_specific_days(test_repo):
             assert d.strftime("%A") == "Sunday"
 
 
+def test_compute_daily_contribution_map_days_unset(test_repo):
+    expected = dict(test_repo.daily_contribution_map)
+    test_repo.days = None  # --days not given on the command line
+    test_repo.reset_daily_contribution_map()
+    test_repo.compute_daily_contribution_map()
+    test_repo.normalize_daily_contribution_map()
+    assert test_repo.daily_contribution_map == expected
+
+
+def test_recompute_daily_contribution_map_reuses_totals(test_repo, monkeypatch):
+    def count_by_day(*args):
+        raise AssertionError("commits counted again")
+
+    monkeypatch.setattr(contributions, "count_by_day", count_by_day)
+    expected = dict(test_repo.daily_contribution_map)
+    test_repo.toggle_day(0)
+    test_repo.recompute_daily_contribution_map()
+    test_repo.toggle_day(0)
+    test_repo.recompute_daily_contribution_map()
+    assert test_repo.daily_contribution_map == expected
+
+
 def test_normalize_daily_contribution_map(test_repo):
     for d in test_repo.daily_contribution_map:
         assert 0 <= test_repo.daily_contribution_map[d] <= 5
@@ -96,22 +126,122 @@ def test_compute_graph_matrix(test_repo):
     assert test_repo.get_matrix_width(matrix) == 106
 
 
-def test_get_top_n_commiters(test_repo):
-    assert test_repo.get_top_n_commiters([]) is None
-    authors_list = [Commit(None, None, "James", None, None)] * 3 + \
-                   [Commit(None, None, "John", None, None),
-                    Commit(None, None, "JJ", None, None)]
-    assert test_repo.get_top_n_commiters(authors_list) == [('James', 3),
-                                                           ('John', 1),
-                                                           ('JJ', 1)]
-
-    authors_list = [Commit(None, None, "James", None, None)] * 30 + \
-                   [Commit(None, None, "John", None, None)] * 10 + \
-                   [Commit(None, None, "JJ", None, None)] * 5
-    assert test_repo.get_top_n_commiters(authors_list,
-                                         normailze_values=True) == [('James', 5),
-                                                                    ('John', 2),
-                                                                    ('JJ', 1)]
+def test_compute_graph_matrix_uses_palette(test_repo):
+    matrix = test_repo.compute_graph_matrix()
+    palette = get_palette(test_repo.colors, test_repo.width)
+    assert palette is test_repo.get_palette()
+    assert palette[0] == colorize(test_repo.width, ansi=0, ansi_bg=test_repo.colors[0])
+    levels = [c[1] for week in matrix for c in week.col if c[0] is not None]
+    assert all(0 <= level < len(palette) for level in levels)
+    assert all(test_repo.paint(level) is palette.blocks[level] for level in levels)
+    assert test_repo.paint(matrix.EMPTY) == test_repo.width
+
+
+def test_switch_color_repaints_same_matrix(test_repo):
+    matrix = test_repo.compute_graph_matrix()
+    levels = [c[1] for week in matrix for c in week.col]
+    test_repo.switch_to_next_color()
+    assert test_repo.get_palette().colors == test_repo.colors
+    assert [c[1] for week in matrix for c in week.col] == levels
+
+
+def test_get_top_committers(test_repo):
+    day = datetime.date(2016, 1, 20)
+    top_n = test_repo.get_top_committers(day)
+    authors = Counter(commit.author for commit in test_repo.commits_db.get(day))
+    assert top_n == normalize_tuple_list(authors.most_common(5), 1, 5)
+    assert test_repo.get_top_committers(datetime.date(2000, 1, 1)) is None
+
+    test_repo.commits_db.top_authors = None  # remembered, not counted again
+    assert test_repo.get_top_committers(day) == top_n
+    test_repo.parse_commits()
+    assert test_repo.get_top_committers(day) == top_n
+
+
+def test_get_top_committers_normalized(test_repo):
+    date = datetime.datetime(2016, 1, 20, 12)
+    test_repo.commits_db = CommitStore()
+    test_repo.commits_db.extend([["79c4705", date, author, "", ""]
+                                 for author in ["James"] * 30 + ["John"] * 10 +
+                                 ["JJ"] * 5])
+    assert test_repo.get_top_committers(date.date()) == [('James', 5),
+                                                         ('John', 2),
+                                                         ('JJ', 1)]
+    assert test_repo.get_top_committers(date.date(), n=2) == [('James', 5),
+                                                              ('John', 1)]
+
+
+def test_print_graph_single_write(test_repo, monkeypatch):
+    writes = []
+    monkeypatch.setattr(sys, "stdout", Mock(write=writes.append))
+    matrix = test_repo.compute_graph_matrix()
+    test_repo.print_graph(matrix)
+    assert writes == [test_repo.format_graph(matrix)]
+    assert writes[0].count("\n") == 14  # rows are separated by a blank line
+
+
+def test_render_to_string(test_repo, monkeypatch):
+    monkeypatch.setattr(sys, "stdout", None)
+    test_repo.gtype = 'inline'
+    test_repo.stat = True
+    output = test_repo.render_to_string()
+    lines = output.splitlines()
+    assert len(lines) == len(test_repo.daily_contribution_map) + 1 + 6
+    assert lines[len(test_repo.daily_contribution_map) + 1] == "Top 5 committers:"
+
+    test_repo.gtype = 'block'
+    test_repo.stat = False
+    test_repo.block_separation_show = ''
+    assert test_repo.render_to_string().count("\n") == 7
+    assert test_repo.render_to_string(columns=10).startswith("Your terminal width")
+
+
+def test_render_to_string_without_contributions(monkeypatch):
+    def log(arguments, as_process=False):
+        return Mock(stdout=log_stream(u""))
+
+    githeat = Githeat(Mock(log=log))
+    monkeypatch.setattr(sys, "stdout", None)
+    assert githeat.render_to_string() == "No contribution found\n"
+    assert not githeat.commits_db
+
+
+def test_run_without_a_terminal(test_repo, monkeypatch):
+    writes = []
+    monkeypatch.setattr(sys, "stdout", Mock(write=writes.append, isatty=lambda: False))
+    test_repo.run()
+    assert writes[0].count("\n") == 14
+
+    test_repo.columns = 10
+    writes[:] = []
+    test_repo.run()
+    assert writes[0].startswith("Your terminal width")
+
+
+def test_lazy_parse_commits(test_repo):
+    from static.test_logs import test_logs
+    dates = u"\n".join(line.split(u"<githeat_delimeter>")[1]
+                       for line in test_logs.splitlines())
+    reads = []
+
+    def log(arguments, as_process=False):
+        reads.append(arguments)
+        if "--pretty=format:%cI" in arguments:
+            return Mock(stdout=log_stream(dates))
+        return Mock(stdout=log_stream())
+
+    githeat = Githeat(Mock(log=log), lazy=True)
+    githeat.parse_commits()
+    githeat.init_daily_contribution_map()
+    githeat.compute_daily_contribution_map()
+    assert githeat.daily_contribution_map == test_repo.daily_contribution_map
+    assert len(reads) == 1
+
+    day = datetime.date(2016, 1, 20)
+    assert [commit.abbr_commit_hash for commit in githeat.commits_db.get(day)] == \
+        [commit.abbr_commit_hash for commit in test_repo.commits_db.get(day)]
+    assert "--since=2016-01-19 00:00:00" in reads[1]
+    assert "--until=2016-01-22 00:00:00" in reads[1]
 
 
 # Make the script executable.
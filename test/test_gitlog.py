@@ -0,0 +1,105 @@
+""" Test suite for the gitlog module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import datetime
+import io
+
+import pytest
+from dateutil.tz import tzoffset
+from mock import Mock
+
+from githeat import gitlog
+from static.test_logs import log_stream
+
+
+def test_log_args():
+    args = gitlog.log_args(author="Will", grep="Fix")
+    assert args[0] == "--since=1 year 7 days"
+    assert "-z" in args
+    assert "--author=Will" in args
+    assert "--grep=Fix" in args
+    assert not [a for a in gitlog.log_args() if a.startswith("--author")]
+
+
+def test_log_args_day_window():
+    day = datetime.date(2016, 2, 29)
+    args = gitlog.log_args(since=gitlog.approxidate(day), until="2016-03-02 00:00:00",
+                           log_format=gitlog.DAY_FORMAT)
+    assert args[:2] == ["--since=2016-02-29 00:00:00", "--until=2016-03-02 00:00:00"]
+    assert "--pretty=format:%cI" in args
+
+
+def test_iter_records_small_chunks():
+    stream = io.BytesIO(b"first\x00second\x00\x00third")
+    assert list(gitlog.iter_records(stream, chunk_size=3)) == [b"first",
+                                                               b"second",
+                                                               b"third"]
+
+
+def test_split_records():
+    assert gitlog.split_records(b"fi", b"rst\x00\x00sec") == ([b"first"], b"sec")
+    assert gitlog.split_records(b"", b"") == ([], b"")
+
+
+def test_iter_records_fixture():
+    records = list(gitlog.iter_records(log_stream(), chunk_size=1024))
+    assert len(records) == 4000
+
+
+def test_iter_log_records():
+    process = Mock(stdout=io.BytesIO(b"a\x00b"))
+    repo = Mock(log=Mock(return_value=process))
+    assert list(gitlog.iter_log_records(repo, ["-z"])) == [b"a", b"b"]
+    repo.log.assert_called_once_with(["-z"], as_process=True)
+    assert process.wait.called
+
+
+def test_parse_record():
+    record = u"79c4705\x1f2015-12-05 04:27:33\x1fJosé\x1fj@x.com\x1fIt's done"
+    assert gitlog.parse_record(record.encode('utf-8')) == ["79c4705",
+                                                           "2015-12-05 04:27:33",
+                                                           "Jose",
+                                                           "j@x.com",
+                                                           "It's done"]
+
+
+def test_parse_commit():
+    record = u"79c4705\x1f2015-12-05T05:27:33+01:00\x1fJos\u00e9\x1fj@x.com\x1fDone"
+    fields = gitlog.parse_commit(record.encode('utf-8'))
+    assert fields[1] == datetime.datetime(2015, 12, 5, 5, 27, 33,
+                                          tzinfo=tzoffset(None, 3600))
+    assert fields[2] == "Jose"
+
+
+def test_parse_commit_date():
+    date = gitlog.parse_commit_date("2015-12-05T05:27:33+01:00")
+    assert date == datetime.datetime(2015, 12, 5, 5, 27, 33,
+                                     tzinfo=tzoffset(None, 3600))
+    assert date.hour == 5
+    date = gitlog.parse_commit_date("2015-12-04T22:57:33-05:30")
+    assert date.date() == datetime.date(2015, 12, 4)
+    assert date.utcoffset() == datetime.timedelta(hours=-5, minutes=-30)
+
+
+def test_parse_commit_date_fallback():
+    assert gitlog.parse_commit_date("2015-12-05 04:27:33") == \
+        datetime.datetime(2015, 12, 5, 4, 27, 33)
+    date = gitlog.parse_commit_date("2015-12-05 04:27:33 +0100")
+    assert date.utcoffset() == datetime.timedelta(hours=1)
+
+
+def test_parse_commit_day():
+    day = datetime.date(2015, 12, 5).toordinal()
+    assert gitlog.parse_commit_day(b"2015-12-05T23:27:33-05:00") == day
+    assert gitlog.parse_commit_day(b"2015-12-05 23:27:33") == day
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
@@ -7,6 +7,7 @@ precedence over the version in this project directory. Use a virtualenv test
 environment or setuptools develop mode to test against the development version.
 
 """
+import datetime
 import os
 from subprocess import call
 from sys import executable
@@ -15,7 +16,12 @@ import functools
 import blessed
 
 import pytest
+from mock import Mock
+
 from githeat import interactive
+from githeat.githeat import Githeat
+from githeat.util.screen import ScreenBuffer
+from static.test_logs import log_stream
 from xtermcolor import colorize
 from argparse import ArgumentTypeError
 
@@ -110,13 +116,27 @@ def test_print_right_header(patch_terminal_size):
 def test_print_footer_left(patch_terminal_size):
     term = TEST_TERMINAL()
     with term.cbreak():
-        screen = {}
+        screen = ScreenBuffer()
         text = "footer left"
         interactive.print_footer_left(term, text, screen)
         assert len(screen) == 1
         assert screen[term.height - 1, 0] == text
 
 
+def test_print_footer_left_progress(patch_terminal_size):
+    term = TEST_TERMINAL()
+    with term.cbreak():
+        screen = ScreenBuffer()
+        progress = " Loading commits... 2,000 "
+        interactive.print_footer_left(term, "footer left", screen, progress)
+        assert len(screen) == 2
+        assert screen[term.height - 1, term.width - len(progress)] == \
+            term.reverse(progress)
+
+        interactive.print_footer_left(term, "footer left", screen)
+        assert list(screen) == [(term.height - 1, 0)]
+
+
 def test_top_authors_to_string():
     authors = [("John", 4), ("Jason", 3), ("James", 2), ("Jordon", 2), ("J", 0)]
     assert interactive.top_authors_to_string(authors) == "John, Jason, James, Jordon, J"
@@ -146,6 +166,100 @@ def test_print_graph_legend(patch_terminal_size):
                   (0, 0): block_width}
         assert screen == result
 
+
+def test_print_graph_writes_changed_cells(patch_terminal_size, monkeypatch):
+    githeat = Githeat(Mock(log=lambda arguments, as_process=False:
+                           Mock(stdout=log_stream())))
+    githeat.parse_commits()
+    githeat.init_daily_contribution_map()
+    githeat.compute_daily_contribution_map()
+    githeat.normalize_daily_contribution_map()
+    githeat.paint = lambda level: u"{:2}".format(level)  # not colored without a tty
+    writes = []
+    monkeypatch.setattr(interactive, 'echo', writes.append)
+
+    term = TEST_TERMINAL(force_styling=True)
+    screen, screen_dates = ScreenBuffer(), {}
+    matrix = githeat.compute_graph_matrix()
+    interactive.print_graph(term, screen, screen_dates, 0, 1, 0, matrix, githeat)
+    assert len(writes) == 1
+    assert writes[0].count(term.move(1, 0)) == 1  # one move per row
+    assert len(screen) == len(screen_dates) == 7 * len(matrix)
+
+    interactive.print_graph(term, screen, screen_dates, 0, 1, 0, matrix, githeat)
+    assert len(writes) == 1  # nothing changed
+
+    first_sunday = min(githeat.daily_contribution_map)
+    githeat.daily_contribution_map[first_sunday] = 5
+    githeat.daily_contribution_map[first_sunday + datetime.timedelta(days=7)] = 5
+    matrix = githeat.compute_graph_matrix()
+    interactive.print_graph(term, screen, screen_dates, 0, 1, 0, matrix, githeat)
+    assert len(writes) == 2
+    #  the two Sundays are adjacent, written in a single run
+    assert writes[1] == term.move(1, 0) + u" 5 5"
+
+
+def test_redraw_single_write(patch_terminal_size, monkeypatch):
+    writes = []
+    monkeypatch.setattr(interactive, 'echo', writes.append)
+    term = TEST_TERMINAL(force_styling=True)
+    screen = ScreenBuffer()
+    screen[3, 1] = "b"
+    screen[0, 0] = "a"
+    screen[3, term.width] = "out of bounds"
+
+    interactive.redraw(term, screen)
+    assert writes == [term.clear + term.move(0, 0) + "a" + term.move(3, 1) + "b"]
+
+    interactive.redraw(term, screen, interactive.Cursor(1, 0, term),
+                       interactive.Cursor(3, 5, term))
+    assert writes[1] == term.move(3, 1) + "b"
+
+
+def test_commit_rows_formats_shown_rows():
+    formatted = []
+
+    def format_row(commit):
+        formatted.append(commit)
+        return "line {}".format(commit)
+
+    built = []
+
+    def commit(row):
+        built.append(row)
+        return row
+
+    rows = interactive.CommitRows(Mock(commit=commit), list(range(1000)),
+                                  format_row, cache_size=3)
+    assert len(rows) == 1000
+    assert formatted == built == []
+    assert [rows[idx] for idx in (0, 1, 2, 0, 3)] == ["line 0", "line 1", "line 2",
+                                                      "line 0", "line 3"]
+    assert formatted == [0, 1, 2, 3]
+    rows[0]
+    rows[1]  # least recently used, so it was dropped
+    assert formatted == built == [0, 1, 2, 3, 1]
+
+
+def test_scroll_commit_rows(patch_terminal_size):
+    term = TEST_TERMINAL(force_styling=True)
+    rows = interactive.CommitRows(Mock(commit=lambda row: row), list(range(1000)),
+                                  str)
+    window = interactive.print_commit_rows(term, rows, 10, 2)
+    assert window.count(term.clear_eol) == term.height - 2
+    assert window.startswith(term.move(2, 0) + "10" + term.clear_eol)
+
+    bottom = term.height - 1
+    scrolled = interactive.scroll_commit_rows(term, rows, 10, 11, 2)
+    assert scrolled == (term.csr(2, bottom) + term.move(bottom, 0) + term.ind +
+                        term.move(bottom, 0) + str(11 + bottom - 2) + term.clear_eol +
+                        term.csr(0, bottom))
+    scrolled = interactive.scroll_commit_rows(term, rows, 10, 9, 2)
+    assert term.ri + term.move(2, 0) + "9" + term.clear_eol in scrolled
+    assert interactive.scroll_commit_rows(term, rows, 10, 100, 2) == \
+        interactive.print_commit_rows(term, rows, 100, 2)
+
+
 # usage: githeat.py [-h] [--width {thick,reg,thin}] [--days DAYS [DAYS ...]]
 #                   [--color {grass,fire,sky}] [--stat-number STAT_NUMBER]
 #                   [--stat] [--month-merge] [--hide-legend] [--author AUTHOR]
@@ -164,20 +278,16 @@ def test__cmdline_invalid_days():
         interactive._cmdline(argv)
 
 
-def test_is_within_boundary_valid():
-    t = interactive.is_within_boundary(100, 0, 0, 100, interactive.Cursor(4, 5, None))
-    assert t is True
-
-
-def test_is_within_boundary_invalid():
-    t = interactive.is_within_boundary(100, 0, 0, 100, interactive.Cursor(200, 200, None))
-    assert t is False
-    t = interactive.is_within_boundary(100, 10, 0, 100, interactive.Cursor(5, 55, None))
-    assert t is False
-    t = interactive.is_within_boundary(100, 0, 10, 100, interactive.Cursor(55, 5, None))
-    assert t is False
-    t = interactive.is_within_boundary(100, 0, 0, 100, interactive.Cursor(55, 200, None))
-    assert t is False
+def test_clear_invalid_region():
+    term = Mock(width=100, height=40)
+    for start, end in (((4, 5), (2, 10)),  # end above start
+                       ((4, 5), (10, 2)),  # end left of start
+                       ((-1, 5), (10, 10)),
+                       ((4, 5), (10, 200)),
+                       ((4, 5), (50, 10))):
+        with pytest.raises(ValueError):
+            interactive.clear(term, interactive.Cursor(start[0], start[1], term),
+                              interactive.Cursor(end[0], end[1], term))
 
 
 def test_resize_until_fit():
@@ -0,0 +1,69 @@
+""" Test suite for the interactive_navigation module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import datetime
+
+import blessed
+import pytest
+
+from githeat.util.interactive_navigation import DayGrid
+from githeat.util.interactive_navigation import lookup_move
+
+
+@pytest.fixture
+def grid():
+    #  two rows of two weeks, with an empty week between months
+    day = datetime.date(2016, 1, 3).toordinal()
+    screen_dates = {}
+    for y in (0, 1):
+        for week, x in enumerate((0, 2, 4, 6)):
+            screen_dates[y, x] = None if week == 2 else \
+                datetime.date.fromordinal(day + week * 7 + y)
+    screen_dates[1, 0] = None  # before the first day
+    return DayGrid(screen_dates)
+
+
+def test_day_grid_index(grid):
+    assert grid.day((0, 0)) == datetime.date(2016, 1, 3)
+    assert grid.day((0, 4)) is None
+    assert grid.positions[datetime.date(2016, 1, 11)] == (1, 2)
+    assert grid.neighbours[0, 2] == ((0, 0), (0, 6), None, (1, 2))
+
+
+def test_day_grid_move(grid):
+    assert grid.move((0, 2), 0, 1) == (0, 6)  # skips the empty week
+    assert grid.move((0, 6), 0, -1) == (0, 2)
+    assert grid.move((0, 0), 1, 0) is None  # nothing below
+    assert grid.move((0, 0), 0, -1) is None
+    assert grid.move((0, 0), 0, 9) == (0, 6)  # as far as it goes
+    assert grid.move((0, 0), 1, 1) == (1, 2)
+    assert grid.center(0) == (0, 2)
+    assert grid.center(5) is None
+
+
+def test_day_grid_replay(grid):
+    #  down then left at the start of the second row stops the left move,
+    #  while the net move would go left first and then find nothing below
+    assert grid.replay((0, 2), [(1, 0), (0, -1)]) == (1, 2)
+    assert grid.move((0, 2), 1, -1) == (0, 0)
+    assert grid.replay((1, 2), [(-1, 0), (0, -1)]) == (0, 0)
+    assert grid.replay((0, 2), [(0, 1), (0, -1)]) is None  # back where it was
+    assert grid.replay((0, 0), [(0, -1), (1, 0)]) is None
+
+
+def test_lookup_move():
+    term = blessed.Terminal(kind='xterm-256color')
+    assert lookup_move(term.KEY_LEFT, term) == (0, -1)
+    assert lookup_move(term.KEY_SDOWN, term) == (4, 0)
+    assert lookup_move(None, term) is None
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
@@ -0,0 +1,70 @@
+""" Test suite for the loader module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import threading
+
+import pytest
+from git import GitCommandError
+from mock import Mock
+
+from githeat.githeat import Githeat
+from githeat.loader import Loader
+from githeat.store import LazyCommitStore
+from static.test_logs import log_stream
+
+
+def test_loader_previews_days_then_replaces_store():
+    release = threading.Event()
+
+    def log(arguments, as_process=False):
+        stream = log_stream()
+        read = stream.read
+
+        def blocking_read(size):
+            data = read(size)
+            if not data:
+                release.wait()  # hold the last batch back until released
+            return data
+        stream.read = blocking_read
+        return Mock(stdout=stream)
+
+    githeat = Githeat(Mock(log=log), days=['Monday'])
+    loader = Loader(githeat)
+    loader.start()
+    assert isinstance(githeat.commits_db, LazyCommitStore)
+
+    while loader.read < 2000:
+        loader.poll()
+    assert not loader.done
+    assert all(day % 7 == 1 for day in githeat.commits_db.days)
+    preview = len(githeat.commits_db.days)
+
+    release.set()
+    assert loader.wait(5)
+    assert loader.done
+    assert len(githeat.commits_db.days) > preview
+    assert githeat.commits_db.count(githeat.commits_db.keys()[0])
+    assert not loader.poll()
+
+
+def test_loader_reraises_errors():
+
+    def log(arguments, as_process=False):
+        raise GitCommandError(['git', 'log'], 128)
+
+    loader = Loader(Githeat(Mock(log=log)))
+    loader.start()
+    with pytest.raises(GitCommandError):
+        loader.wait(5)
+    assert loader.done
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
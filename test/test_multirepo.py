@@ -0,0 +1,47 @@
+""" Test suite for the multirepo module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import pytest
+
+from githeat import multirepo
+from static.git_repos import git_repo
+
+
+def test_repo_paths(tmpdir):
+    first = tmpdir.mkdir("first")
+    second = tmpdir.mkdir("second")
+    tmpdir.join("file").write("")
+    repos_from = tmpdir.join("repos")
+    repos_from.write("# my repos\n{}\n\n{}\n".format(second, first))
+
+    assert multirepo.repo_paths(str(repos_from)) == [str(second), str(first)]
+    assert multirepo.repo_paths(pattern=str(tmpdir.join("*"))) == [str(first),
+                                                                  str(second)]
+    #  duplicates are dropped
+    assert multirepo.repo_paths(str(repos_from),
+                                str(tmpdir.join("*"))) == [str(second), str(first)]
+
+
+@pytest.mark.parametrize("pool", [True, False])
+def test_collect(tmpdir, monkeypatch, pool):
+    if not pool:
+        monkeypatch.setattr(multirepo, "ProcessPoolExecutor", None)
+    paths = [git_repo(tmpdir.join("first"), "James", 3),
+             git_repo(tmpdir.join("second"), "John", 2),
+             str(tmpdir.join("missing")),
+             str(tmpdir.join("first").mkdir("docs"))]  # inside a repository
+
+    commits = multirepo.collect(paths, multirepo.repo_commits, cache=False)
+    assert len(commits.days) == 5
+    assert commits.top_authors() == [("James", 3), ("John", 2)]
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
@@ -0,0 +1,66 @@
+""" Test suite for the normalize module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import pytest
+
+from githeat.util import helpers
+from githeat.util import normalize
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        if normalize.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(normalize, "np", None)
+    return request.param
+
+
+def test_linear(engine):
+    assert normalize.linear([0, 3, 5], 0, 5) == [0, 3, 5]
+    assert normalize.linear([0, 10, 20, 30], 0, 5) == [0, 2, 4, 5]
+    assert normalize.linear([7, 7], 0, 5) == [0, 0]
+    assert normalize.linear([], 0, 5) == []
+
+
+def test_log(engine):
+    levels = normalize.log([0, 1, 2, 3, 4, 100], 0, 5)
+    assert levels[0] == 0
+    assert levels[-1] == 5
+    #  one busy day doesn't push every other day down to the first level
+    assert levels[1:5] == [1, 2, 2, 2]
+
+
+def test_quantile(engine):
+    counts = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 1000]
+    levels = normalize.quantile(counts, 0, 5)
+    assert levels == [0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 5]
+    assert normalize.quantile([0, 0], 0, 5) == [0, 0]
+
+
+def test_normalize_does_not_mutate(engine):
+    counts = [0, 10, 20]
+    assert normalize.normalize(counts, 0, 5, scale='quantile') == [0, 3, 5]
+    assert counts == [0, 10, 20]
+
+    dictionary = {'a': 0, 'b': 10, 'c': 20}
+    assert helpers.normalize_dict(dictionary, 0, 5) == {'a': 0, 'b': 3, 'c': 5}
+    assert dictionary == {'a': 0, 'b': 10, 'c': 20}
+
+    tuple_list = [('James', 30), ('John', 10), ('JJ', 5)]
+    assert helpers.normalize_tuple_list(tuple_list, 1, 5) == [('James', 5),
+                                                              ('John', 2),
+                                                              ('JJ', 1)]
+    assert tuple_list[0] == ('James', 30)
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
@@ -0,0 +1,150 @@
+""" Test suite for the odb module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import binascii
+import subprocess
+
+import pytest
+from git import Git
+from mock import Mock
+
+from githeat import odb
+from githeat.githeat import Githeat
+from static.git_repos import git_repo
+
+
+@pytest.fixture(params=["loose", "packed", "commit-graph"])
+def repo(request, tmpdir):
+    path = git_repo(tmpdir.join("repo"), "José", 5)
+    if request.param != "loose":
+        subprocess.check_call(["git", "-C", path, "gc", "-q"])
+    if request.param == "commit-graph":
+        subprocess.check_call(["git", "-C", path, "commit-graph", "write",
+                               "--reachable"])
+    return path
+
+
+def _git(path, *args):
+    return subprocess.check_output(("git", "-C", path) + args).decode('utf-8')
+
+
+def test_apply_delta():
+    base = b"0123456789"
+    #  sizes 10 and 8, copy 4 bytes from offset 2, insert 'abcd'
+    delta = b"\x0a\x08\x91\x02\x04\x04abcd"
+    assert odb._apply_delta(base, delta) == b"2345abcd"
+    with pytest.raises(ValueError):
+        odb._apply_delta(b"short", delta)
+
+
+def test_parse_commit():
+    data = (b"tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n"
+            b"parent 79c4705e9f1f64e1a2c8c1bfbe3c5d1b2ea0a0b1\n"
+            b"author Jane Doe <jane@example.com> 1449289653 +0100\n"
+            b"committer John Doe <john@example.com> 1449289700 -0530\n"
+            b"gpgsig -----BEGIN PGP SIGNATURE-----\n"
+            b" parent 0000000000000000000000000000000000000000\n"
+            b" -----END PGP SIGNATURE-----\n"
+            b"\n"
+            b"\n"
+            b"First line\n"
+            b"second line  \n"
+            b"\n"
+            b"Body\n")
+    commit = odb.parse_commit(data)
+    assert len(commit.parents) == 1
+    assert (commit.author, commit.email) == ("Jane Doe", "jane@example.com")
+    assert (commit.time, commit.utc_offset) == (1449289700, -19800)
+    assert commit.subject == "First line second line"
+
+
+def test_log_matches_git_log(repo):
+    githeat = Githeat(Git(repo))
+    expected = list(githeat.read_git_log())
+    assert githeat.read_objects() == expected
+
+    revision = "{}..HEAD".format(_git(repo, "rev-parse", "HEAD~3").strip())
+    assert githeat.read_objects(revision) == list(githeat.read_git_log(revision))
+
+
+def test_commit_graph(tmpdir):
+    path = git_repo(tmpdir.join("repo"), "James", 3)
+    default_branch = _git(path, "symbolic-ref", "--short", "HEAD").strip()
+    for branch in ("first", "second"):
+        _git(path, "checkout", "-q", "-b", branch, default_branch + "~1")
+        _git(path, "-c", "user.name=John", "-c", "user.email=john@example.com",
+             "commit", "-q", "--allow-empty", "-m", branch)
+    _git(path, "checkout", "-q", default_branch)
+    _git(path, "-c", "user.name=John", "-c", "user.email=john@example.com",
+         "merge", "-q", "--no-edit", "first", "second")  # octopus
+    _git(path, "commit-graph", "write", "--reachable")
+
+    database = odb.ObjectDatabase(path)
+    assert database.graph.count == 6
+    for line in _git(path, "rev-list", "--all").split():
+        sha = binascii.unhexlify(line)
+        time, parents = database.graph.commit(database.graph.position(sha))
+        commit = database.commit(sha)
+        assert time == commit.time
+        assert [database.graph.name(p) for p in parents] == commit.parents
+
+    githeat = Githeat(Git(path))
+    assert githeat.read_objects() == list(githeat.read_git_log())
+    assert odb.ObjectDatabase(path, commit_graph=False).graph is None
+
+
+def test_backend_falls_back_to_git_log(repo, monkeypatch):
+    githeat = Githeat(Git(repo), backend='odb', author="John")
+    assert githeat.read_objects() is None
+    assert len(list(githeat.read_log())) == 0
+
+    githeat = Githeat(Git(repo), backend='odb')
+    monkeypatch.setattr(githeat, "read_git_log", None)
+    revision = "{}..HEAD".format(_git(repo, "rev-parse", "HEAD~3").strip())
+    assert len(list(githeat.read_log(revision))) == 3
+
+
+def test_backend_reads_whole_window_with_git_log(tmpdir, monkeypatch):
+    path = git_repo(tmpdir.join("repo"), "James", 3)
+    _git(path, "commit-graph", "write", "--reachable")
+    githeat = Githeat(Git(path), backend='odb')
+    monkeypatch.setattr(githeat, "read_objects", None)
+    assert len(list(githeat.read_log())) == 3
+
+
+def test_unsupported_layouts(tmpdir, monkeypatch):
+    with pytest.raises(odb.UnsupportedRepository):
+        odb.ObjectDatabase(str(tmpdir))
+
+    path = git_repo(tmpdir.join("repo"), "James", 1)
+    subprocess.check_call(["git", "-C", path, "config", "extensions.partialClone",
+                           "origin"])
+    with pytest.raises(odb.UnsupportedRepository):
+        odb.ObjectDatabase(path)
+
+
+def test_unreadable_objects_fall_back_to_git_log(tmpdir, monkeypatch):
+    path = git_repo(tmpdir.join("repo"), "James", 3)
+    _git(path, "gc", "-q")
+    githeat = Githeat(Git(path), backend='odb')
+    revision = "{}..HEAD".format(_git(path, "rev-parse", "HEAD~2").strip())
+    expected = list(githeat.read_git_log(revision))
+
+    monkeypatch.setattr(odb, "_TYPES", {})  # unknown object types
+    assert githeat.read_objects(revision) is None
+    assert list(githeat.read_log(revision)) == expected
+
+    monkeypatch.setattr(odb, "sys", Mock(version_info=(2, 7)))
+    with pytest.raises(odb.UnsupportedRepository):
+        odb.ObjectDatabase(path)
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
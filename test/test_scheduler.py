@@ -0,0 +1,77 @@
+""" Test suite for the scheduler module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import blessed
+from blessed.keyboard import Keystroke
+import pytest
+
+from githeat.util.interactive_navigation import lookup_move
+from githeat.util.scheduler import InputScheduler
+from githeat.util.scheduler import Move
+
+TERM = blessed.Terminal(kind='xterm-256color')
+
+
+class FakeTerminal:
+    """
+    Terminal whose keys are pressed at set times of a fake clock
+    """
+
+    def __init__(self, keys):
+        self.keys = keys  # list of (time, Keystroke)
+        self.now = 0.0
+        self.waits = []
+
+    def __getattr__(self, name):
+        return getattr(TERM, name)
+
+    def clock(self):
+        return self.now
+
+    def inkey(self, timeout=None):
+        self.waits.append(timeout)
+        if self.keys and (timeout is None or self.keys[0][0] <= self.now + timeout):
+            pressed, key = self.keys.pop(0)
+            self.now = max(self.now, pressed)
+            return key
+        self.now += timeout or 0
+        return Keystroke(u'')
+
+
+RIGHT = Keystroke(u'\x1b[C', code=TERM.KEY_RIGHT)
+UP = Keystroke(u'\x1b[A', code=TERM.KEY_UP)
+ENTER = Keystroke(u'\r')
+
+
+def test_scheduler_coalesces_moves():
+    term = FakeTerminal([(0, RIGHT), (0, RIGHT), (0, UP), (0, ENTER), (0, RIGHT)])
+    keys = InputScheduler(term, lookup_move, clock=term.clock)
+    assert keys.read() == [Move([(0, 1), (0, 1), (-1, 0)]), ENTER, Move([(0, 1)])]
+    assert keys.read(timeout=0.1) == []
+
+
+def test_scheduler_caps_frame_rate():
+    term = FakeTerminal([(0, RIGHT), (0.01, RIGHT), (0.02, RIGHT), (0.5, RIGHT)])
+    keys = InputScheduler(term, lookup_move, frame_rate=10, clock=term.clock)
+    assert keys.read() == [Move([(0, 1)])]
+    #  the next frame is due at 0.1, keys pressed until then are read with it
+    assert keys.read() == [Move([(0, 1)] * 2)]
+    assert term.now >= 0.1
+    assert keys.read() == [Move([(0, 1)])]
+
+
+def test_scheduler_max_keys():
+    term = FakeTerminal([(0, RIGHT)] * 10)
+    keys = InputScheduler(term, lookup_move, max_keys=4, clock=term.clock)
+    assert keys.read() == [Move([(0, 1)] * 4)]
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
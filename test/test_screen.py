@@ -0,0 +1,65 @@
+""" Test suite for the screen module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import pytest
+
+from githeat.util.screen import ScreenBuffer
+
+
+@pytest.fixture
+def screen():
+    screen = ScreenBuffer()
+    screen[5, 10] = "c"
+    screen[0, 4] = "b"
+    screen[5, 2] = "d"
+    screen[0, 0] = "a"
+    return screen
+
+
+def test_screen_buffer_mapping(screen):
+    assert len(screen) == 4
+    assert screen[0, 4] == "b"
+    assert screen.get((5, 3)) is None
+    assert screen.get((7, 0), "  ") == "  "
+    with pytest.raises(KeyError):
+        screen[1, 1]
+    screen[0, 4] = "B"
+    assert len(screen) == 4
+    assert screen == {(0, 0): "a", (0, 4): "B", (5, 2): "d", (5, 10): "c"}
+
+
+def test_screen_buffer_sorted(screen):
+    assert list(screen) == [(0, 0), (0, 4), (5, 2), (5, 10)]
+    assert screen.row(5) == [(2, "d"), (10, "c")]
+    assert screen.row(3) == []
+
+
+def test_screen_buffer_region(screen):
+    assert list(screen.region(0, 3, 5, 9)) == [((0, 4), "b")]
+    assert [key for key, _ in screen.region(0, 0, 4, 100)] == [(0, 0), (0, 4)]
+    assert [key for key, _ in screen.region(1, 0, 100, 100)] == [(5, 2), (5, 10)]
+
+
+def test_screen_buffer_bounds(screen):
+    assert screen.bounds() == (0, 0, 5, 10)
+    del screen[5, 10]
+    assert screen.bounds() == (0, 0, 5, 4)
+    screen[9, 1] = "e"
+    assert screen.bounds() == (0, 0, 9, 4)
+    for key in list(screen):
+        del screen[key]
+    assert screen.bounds() is None
+    assert list(screen) == []
+    screen[2, 3] = "f"
+    assert screen.bounds() == (2, 3, 2, 3)
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
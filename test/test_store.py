@@ -0,0 +1,144 @@
+""" Test suite for the store module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import datetime
+import pickle
+
+import pytest
+from dateutil.tz import tzoffset
+
+from githeat.store import Commit
+from githeat.store import CommitStore
+from githeat.store import LazyCommitStore
+
+TZ = tzoffset(None, -5 * 3600)
+
+RECORDS = [
+    ["79c4705", datetime.datetime(2015, 12, 5, 23, 27, 33, tzinfo=TZ),
+     "Katrina Grimes", "k@espinoza.com", "Veniam fuga ullam."],
+    ["e90f07a", datetime.datetime(2015, 12, 5, 0, 26, 11),
+     "Jennifer Brady", "cbrown@hotmail.com", u"Iste d\xe9leniti."],
+    ["200b8a9", datetime.datetime(2015, 12, 6, 10, 0, 0, tzinfo=TZ),
+     "Katrina Grimes", "k@espinoza.com", "Quidem aperiam."],
+]
+
+
+@pytest.fixture
+def commits():
+    store = CommitStore()
+    store.extend(RECORDS)
+    return store
+
+
+def test_commit_store_lookup_by_date(commits):
+    assert len(commits) == 2
+    assert sorted(commits) == [datetime.date(2015, 12, 5), datetime.date(2015, 12, 6)]
+    assert commits.count(datetime.date(2015, 12, 5)) == 2
+    assert commits.count(datetime.date(2015, 12, 7)) == 0
+    assert commits.get(datetime.date(2015, 12, 7)) is None
+    assert list(commits.rows(datetime.date(2015, 12, 6))) == [2]
+    assert list(commits.rows(datetime.date(2015, 12, 7))) == []
+    assert commits[datetime.date(2015, 12, 7)] == []
+    assert datetime.date(2015, 12, 6) in commits
+
+    first, second = commits.get(datetime.date(2015, 12, 5))
+    assert [first.abbr_commit_hash, first.date, first.author, first.author_email,
+            first.subject] == RECORDS[0]
+    assert first.date.utcoffset() == datetime.timedelta(hours=-5)
+    assert second.date.tzinfo is None
+    assert second.subject == u"Iste d\xe9leniti."
+
+
+def test_commit_store_interns_authors(commits):
+    assert len(commits.authors) == 2
+    assert len(commits.emails) == 2
+    assert commits.top_authors(1) == [("Katrina Grimes", 2)]
+
+
+def test_commits_share_author_strings(commits):
+    assert Commit.__slots__ == ('abbr_commit_hash', 'date', 'author',
+                                'author_email', 'subject')
+    assert not hasattr(commits.commit(0), '__dict__')
+    first, third = commits.commit(0), commits.commit(2)
+    assert first.author == third.author == "Katrina Grimes"
+    assert first.author is third.author
+    assert first.author_email is third.author_email
+
+
+def test_commit_store_select_and_update(commits):
+    since = datetime.date(2015, 12, 6).toordinal()
+    selected = commits.select(lambda day: day >= since)
+    assert list(selected) == [datetime.date(2015, 12, 6)]
+    assert len(selected.authors) == 1
+
+    selected.update(commits)
+    assert len(selected.days) == 4
+    assert selected.count(datetime.date(2015, 12, 6)) == 2
+
+
+def test_commit_store_top_authors_on_day(commits):
+    saturday = datetime.date(2015, 12, 5)
+    assert commits.top_authors(day=saturday) == [("Katrina Grimes", 1),
+                                                 ("Jennifer Brady", 1)]
+    assert commits.top_authors(1, datetime.date(2015, 12, 6)) == [("Katrina Grimes", 1)]
+    assert commits.top_authors(day=datetime.date(2015, 1, 1)) == []
+
+
+def test_commit_store_pickle(commits):
+    loaded = pickle.loads(pickle.dumps(commits, pickle.HIGHEST_PROTOCOL))
+    assert sorted(loaded) == sorted(commits)
+    assert [c.subject for c in loaded[datetime.date(2015, 12, 5)]] == \
+           [c.subject for c in commits[datetime.date(2015, 12, 5)]]
+
+
+def test_lazy_commit_store_loads_a_day_on_demand():
+    reads = []
+
+    def read_log(since, until):
+        reads.append((since, until))
+        return RECORDS
+
+    commits = LazyCommitStore(read_log)
+    commits.days.extend(record[1].toordinal() for record in RECORDS)
+    day = datetime.date(2015, 12, 5)
+
+    assert len(commits) == 2
+    assert commits.count(day) == 2
+    assert day in commits
+    assert not commits.is_loaded(day)
+    assert reads == []
+
+    assert [commit.abbr_commit_hash for commit in commits[day]] == ["79c4705",
+                                                                "e90f07a"]
+    assert commits.is_loaded(day)
+    assert reads == [(datetime.date(2015, 12, 4), datetime.date(2015, 12, 7))]
+
+    assert [commits.commit(row).abbr_commit_hash
+            for row in commits.rows(day)] == ["79c4705", "e90f07a"]
+    assert commits.get(datetime.date(2015, 1, 1)) is None
+    assert len(reads) == 1  # loaded days and days without commits aren't read
+
+    assert commits.top_authors(1) == [("Katrina Grimes", 2)]
+    assert reads[-1] == (None, None)
+
+
+def test_lazy_commit_store_select():
+    commits = LazyCommitStore(lambda since, until: RECORDS)
+    commits.days.extend(record[1].toordinal() for record in RECORDS)
+    saturday = datetime.date(2015, 12, 5)
+    selected = commits.select(lambda day: day == saturday.toordinal())
+
+    assert list(selected) == [saturday]
+    assert selected.count(saturday) == 2
+    assert selected.top_authors() == [("Katrina Grimes", 1), ("Jennifer Brady", 1)]
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))
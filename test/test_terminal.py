@@ -0,0 +1,45 @@
+""" Test suite for the terminal module.
+
+The script can be executed on its own or incorporated into a larger test suite.
+However the tests are run, be aware of which version of the module is actually
+being tested. If the library is installed in site-packages, that version takes
+precedence over the version in this project directory. Use a virtualenv test
+environment or setuptools develop mode to test against the development version.
+
+"""
+import io
+from collections import namedtuple
+
+import pytest
+from mock import Mock
+
+from githeat.util import terminal
+
+Size = namedtuple("Size", "columns lines")
+
+
+def test_terminal_columns_override():
+    assert terminal.terminal_columns(120, stream=io.StringIO()) == 120
+    tty = Mock(isatty=lambda: True)
+    assert terminal.terminal_columns(0, stream=tty) == 0  # not detected
+
+
+def test_terminal_columns_not_a_tty():
+    assert terminal.terminal_columns(stream=io.StringIO()) is None
+    assert terminal.terminal_columns(stream=object()) is None
+
+
+def test_terminal_columns_tty(monkeypatch):
+    tty = Mock(isatty=lambda: True)
+    monkeypatch.setattr(terminal, "get_terminal_size",
+                        lambda fallback: Size(132, 40))
+    assert terminal.terminal_columns(stream=tty) == 132
+
+    monkeypatch.setattr(terminal, "get_terminal_size",
+                        lambda fallback: Size(*fallback))
+    assert terminal.terminal_columns(stream=tty) is None
+
+
+# Make the script executable.
+if __name__ == "__main__":
+    raise SystemExit(pytest.main(__file__))